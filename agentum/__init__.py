@@ -1,84 +1,69 @@
-__version__ = "1.0.0"
+import importlib
+import os
 
-# Core framework components
-from .agent.agent import Agent
+from ._version import __version__  # noqa: F401
 
-# Core utilities
-from .core.exceptions import (
-    AgentumError,
-    CompilationError,
-    ExecutionError,
-    MemoryError,
-    RAGError,
-    StateValidationError,
-    TaskConfigurationError,
-    ToolError,
-    WorkflowDefinitionError,
-)
-from .core.messages import AIMessage, HumanMessage, ToolMessage
-
-# Memory implementations
-from .memory.implementations import ConversationMemory
-
-# Provider implementations
-from .providers import AnthropicLLM, GoogleLLM, OpenAILLM
-
-# RAG components
-from .rag.knowledge_base import KnowledgeBase
-from .state.state import State
-
-# Testing components
-from .testing.evaluator import Evaluator
-from .testing.test_suite import TestSuite
+# Bound eagerly: importing the agentum.tool subpackage would otherwise shadow it.
 from .tool.tool import tool
 
-# Built-in tools
-from .tools import (
-    create_vector_search_tool,
-    read_file,
-    search_web_tavily,
-    text_to_speech,
-    transcribe_audio,
-    write_file,
-)
-from .workflow.workflow import Workflow
-
-__all__ = [
+_LAZY = {
     # Core components
-    "Agent",
-    "State",
-    "tool",
-    "Workflow",
+    "Agent": ("agentum.agent.agent", "Agent"),
+    "State": ("agentum.state.state", "State"),
+    "Workflow": ("agentum.workflow.workflow", "Workflow"),
+    # Caching
+    "LLMCache": ("agentum.cache.llm_cache", "LLMCache"),
     # Providers
-    "GoogleLLM",
-    "AnthropicLLM",
-    "OpenAILLM",
+    "GoogleLLM": ("agentum.providers", "GoogleLLM"),
+    "AnthropicLLM": ("agentum.providers", "AnthropicLLM"),
+    "OpenAILLM": ("agentum.providers", "OpenAILLM"),
     # Messages
-    "AIMessage",
-    "HumanMessage",
-    "ToolMessage",
+    "AIMessage": ("agentum.core.messages", "AIMessage"),
+    "HumanMessage": ("agentum.core.messages", "HumanMessage"),
+    "ToolMessage": ("agentum.core.messages", "ToolMessage"),
     # Memory
-    "ConversationMemory",
+    "ConversationMemory": ("agentum.memory.implementations", "ConversationMemory"),
     # RAG
-    "KnowledgeBase",
+    "KnowledgeBase": ("agentum.rag.knowledge_base", "KnowledgeBase"),
     # Tools
-    "create_vector_search_tool",
-    "search_web_tavily",
-    "write_file",
-    "read_file",
-    "transcribe_audio",
-    "text_to_speech",
+    "create_vector_search_tool": ("agentum.tools", "create_vector_search_tool"),
+    "search_web_tavily": ("agentum.tools", "search_web_tavily"),
+    "write_file": ("agentum.tools", "write_file"),
+    "read_file": ("agentum.tools", "read_file"),
+    "transcribe_audio": ("agentum.tools", "transcribe_audio"),
+    "text_to_speech": ("agentum.tools", "text_to_speech"),
     # Testing
-    "TestSuite",
-    "Evaluator",
+    "TestSuite": ("agentum.testing.test_suite", "TestSuite"),
+    "Evaluator": ("agentum.testing.evaluator", "Evaluator"),
     # Exceptions
-    "AgentumError",
-    "WorkflowDefinitionError",
-    "TaskConfigurationError",
-    "StateValidationError",
-    "CompilationError",
-    "ExecutionError",
-    "ToolError",
-    "MemoryError",
-    "RAGError",
-]
+    "AgentumError": ("agentum.core.exceptions", "AgentumError"),
+    "WorkflowDefinitionError": ("agentum.core.exceptions", "WorkflowDefinitionError"),
+    "TaskConfigurationError": ("agentum.core.exceptions", "TaskConfigurationError"),
+    "StateValidationError": ("agentum.core.exceptions", "StateValidationError"),
+    "CompilationError": ("agentum.core.exceptions", "CompilationError"),
+    "ExecutionError": ("agentum.core.exceptions", "ExecutionError"),
+    "ToolError": ("agentum.core.exceptions", "ToolError"),
+    "MemoryError": ("agentum.core.exceptions", "MemoryError"),
+    "RAGError": ("agentum.core.exceptions", "RAGError"),
+}
+
+__all__ = ("tool", *_LAZY)
+
+
+def __getattr__(name):
+    spec = _LAZY.get(name)
+    if not spec:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(spec[0])
+    obj = getattr(module, spec[1])
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(list(globals()) + list(_LAZY)))
+
+
+if os.environ.get("AGENTUM_EAGER_IMPORT") == "1":
+    for _name in _LAZY:
+        __getattr__(_name)
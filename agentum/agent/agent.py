@@ -1,15 +1,59 @@
-from typing import Any, List, Optional
-
-from pydantic import BaseModel, ConfigDict
+import asyncio
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
 
+from ..cache.llm_cache import LLMCache
 from ..providers.base import BaseLLM
 
+if TYPE_CHECKING:
+    from ..memory.base import MemoryProtocol
+
 
-class Agent(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+@dataclass(slots=True)
+class Agent:
     name: str
     system_prompt: str
     llm: BaseLLM
-    tools: Optional[List[Any]] = None
-    memory: Optional[Any] = None
+    tools: Optional[List[Callable]] = None
+    memory: Optional["MemoryProtocol"] = None
     max_retries: int = 3
+    cache: Optional[LLMCache] = None
+    _bound: Optional[Tuple[Any, Tuple[Callable, ...], Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any):
+        if name in ("llm", "tools"):
+            object.__setattr__(self, "_bound", None)
+        object.__setattr__(self, name, value)
+
+    def bound_llm(self) -> Any:
+        # The memo holds the model and tools themselves, so ids are never reused.
+        tools = tuple(self.tools or ())
+        bound = self._bound
+        if bound is None or bound[0] is not self.llm or bound[1] != tools:
+            llm = self.llm.bind_tools(list(tools)) if tools else self.llm
+            bound = self._bound = (self.llm, tools, llm)
+        return bound[2]
+
+    async def invoke(self, messages: List[Any], llm: Optional[Any] = None) -> Any:
+        runnable = llm if llm is not None else self.llm
+        cache = self.cache
+        if cache is None or not cache.is_cacheable(self.llm):
+            return await runnable.ainvoke(messages)
+        key = cache.make_key(self.llm, self.system_prompt, messages, self.tools)
+        response = cache.get(key)
+        if response is not None:
+            return response
+        if cache.embedder is None or not cache.is_text_only(messages):
+            response = await runnable.ainvoke(messages)
+            cache.set(key, response)
+            return response
+        scope = cache.make_scope(self.llm, self.system_prompt, self.tools)
+        vector = await asyncio.to_thread(cache.embed, messages)
+        response = cache.get_similar(scope, vector)
+        if response is None:
+            response = await runnable.ainvoke(messages)
+            cache.set_similar(scope, key, vector, response)
+        cache.set(key, response)
+        return response
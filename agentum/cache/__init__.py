@@ -0,0 +1,15 @@
+from .llm_cache import (
+    DiskBackend,
+    InMemoryBackend,
+    LLMCache,
+    SemanticIndex,
+    sentence_transformer_embedder,
+)
+
+__all__ = [
+    "LLMCache",
+    "InMemoryBackend",
+    "DiskBackend",
+    "SemanticIndex",
+    "sentence_transformer_embedder",
+]
@@ -0,0 +1,237 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+
+Embedder = Callable[[str], Sequence[float]]
+
+
+class InMemoryBackend:
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        expires_at = time.time() + ttl if ttl is not None else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+def _dump_value(value: Any) -> str:
+    if isinstance(value, BaseMessage):
+        return json.dumps({"message": message_to_dict(value)})
+    return json.dumps({"value": value})
+
+
+def _load_value(raw: Any) -> Optional[Any]:
+    try:
+        payload = json.loads(raw)
+        if "message" in payload:
+            return messages_from_dict([payload["message"]])[0]
+        return payload["value"]
+    except (ValueError, KeyError, TypeError):
+        # Rows written by an older format are treated as misses.
+        return None
+
+
+class DiskBackend:
+
+    def __init__(self, path: str = "agentum.cache/agent.sqlite"):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache "
+            "(key TEXT PRIMARY KEY, value BLOB, expires_at INT)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            with self._lock:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._conn.commit()
+            return None
+        return _load_value(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        expires_at = int(time.time() + ttl) if ttl is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) "
+                "VALUES (?, ?, ?)",
+                (key, _dump_value(value), expires_at),
+            )
+            self._conn.commit()
+
+
+def _message_payload(message: Any) -> Any:
+    if isinstance(message, str):
+        return message
+    return {
+        "type": getattr(message, "type", type(message).__name__),
+        "content": getattr(message, "content", message),
+        "tool_calls": getattr(message, "tool_calls", None),
+        "tool_call_id": getattr(message, "tool_call_id", None),
+    }
+
+
+def _prompt_text(messages: List[Any]) -> str:
+    parts = []
+    for message in messages:
+        content = getattr(message, "content", message)
+        if isinstance(content, list):
+            content = " ".join(
+                part.get("text", "") for part in content if isinstance(part, dict)
+            )
+        parts.append(str(content))
+    return "\n".join(parts)
+
+
+def sentence_transformer_embedder(model_name: str = "all-MiniLM-L6-v2") -> Embedder:
+    model = None
+
+    def embed(text: str) -> Sequence[float]:
+        nonlocal model
+        if model is None:
+            from sentence_transformers import SentenceTransformer
+
+            model = SentenceTransformer(model_name)
+        return model.encode(text)
+
+    return embed
+
+
+class SemanticIndex:
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: Dict[str, OrderedDict] = {}
+        self._matrices: Dict[str, Any] = {}
+
+    def search(self, scope: str, vector: Any, threshold: float) -> Optional[Any]:
+        entries = self._entries.get(scope)
+        if not entries:
+            return None
+        import numpy as np
+
+        matrix = self._matrices.get(scope)
+        if matrix is None:
+            matrix = self._matrices[scope] = np.vstack([v for v, _ in entries.values()])
+        scores = matrix @ vector
+        best = int(scores.argmax())
+        if scores[best] < threshold:
+            return None
+        return list(entries.values())[best][1]
+
+    def add(self, scope: str, key: str, vector: Any, value: Any):
+        entries = self._entries.setdefault(scope, OrderedDict())
+        entries[key] = (vector, value)
+        entries.move_to_end(key)
+        while len(entries) > self.maxsize:
+            entries.popitem(last=False)
+        self._matrices.pop(scope, None)
+
+
+class LLMCache:
+
+    def __init__(
+        self,
+        backend: Optional[Any] = None,
+        ttl: Optional[int] = None,
+        embedder: Optional[Embedder] = None,
+        similarity_threshold: float = 0.97,
+        semantic_maxsize: int = 1024,
+    ):
+        self.backend = backend if backend is not None else InMemoryBackend()
+        self.ttl = ttl
+        self.embedder = embedder
+        self.similarity_threshold = similarity_threshold
+        self._semantic = SemanticIndex(semantic_maxsize) if embedder else None
+
+    @staticmethod
+    def is_cacheable(llm: Any) -> bool:
+        return getattr(llm, "temperature", None) == 0
+
+    @staticmethod
+    def is_text_only(messages: List[Any]) -> bool:
+        # Embeddings only see text, so images and other parts would be ignored.
+        for message in messages:
+            content = getattr(message, "content", message)
+            if isinstance(content, list) and any(
+                not isinstance(part, dict) or part.get("type", "text") != "text"
+                for part in content
+            ):
+                return False
+        return True
+
+    @staticmethod
+    def make_key(
+        llm: Any,
+        system_prompt: str,
+        messages: List[Any],
+        tools: Optional[List[Any]] = None,
+    ) -> str:
+        payload = {
+            "model": getattr(llm, "model", None) or getattr(llm, "model_name", None),
+            "messages": [_message_payload(m) for m in messages],
+            "tools": sorted(t.__name__ for t in tools) if tools else None,
+            "system": system_prompt,
+        }
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    @staticmethod
+    def make_scope(
+        llm: Any, system_prompt: str, tools: Optional[List[Any]] = None
+    ) -> str:
+        return LLMCache.make_key(llm, system_prompt, [], tools)
+
+    def embed(self, messages: List[Any]) -> Any:
+        import numpy as np
+
+        vector = np.asarray(self.embedder(_prompt_text(messages)), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.backend.get(key)
+
+    def set(self, key: str, value: Any):
+        self.backend.set(key, value, ttl=self.ttl)
+
+    def get_similar(self, scope: str, vector: Any) -> Optional[Any]:
+        return self._semantic.search(scope, vector, self.similarity_threshold)
+
+    def set_similar(self, scope: str, key: str, vector: Any, value: Any):
+        if not getattr(value, "tool_calls", None):
+            self._semantic.add(scope, key, vector, value)
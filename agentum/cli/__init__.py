@@ -0,0 +1,12 @@
+import importlib
+
+_RICH_EXPORTS = {"Panel": "rich.panel", "Syntax": "rich.syntax"}
+
+
+def __getattr__(name):
+    module_name = _RICH_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import typer
+
+from ._common import _console
+from ._loader import _load_workflow
+
+if TYPE_CHECKING:
+    from ..workflow.workflow import Workflow
+
+cli = typer.Typer(add_completion=False)
+
+
+def _quote(value: str) -> str:
+    return '"' + value.replace('"', '\\"') + '"'
+
+
+def _dot_source(workflow: Workflow) -> str:
+    lines = [
+        "digraph {",
+        "\trankdir=TB",
+        '\tnode [fillcolor=lightblue shape=box style="rounded,filled"]',
+    ]
+    for task_name in workflow.tasks:
+        if task_name == workflow.entry_point:
+            lines.append(
+                f"\t{_quote(task_name)} [label={_quote('🚀 ' + task_name)}"
+                " fillcolor=lightgreen]"
+            )
+        else:
+            lines.append(f"\t{_quote(task_name)}")
+    tuple_edges = [e for e in workflow.edges if isinstance(e, tuple)]
+    dict_edges = [e for e in workflow.edges if isinstance(e, dict)]
+    has_end = any(e[1] == workflow.END for e in tuple_edges) or any(
+        workflow.END in e["paths"].values() for e in dict_edges
+    )
+    if has_end:
+        lines.append(f'\t{_quote(workflow.END)} [label="🏁 END" fillcolor=lightcoral]')
+    for source, target in tuple_edges:
+        lines.append(f"\t{_quote(source)} -> {_quote(target)}")
+    for edge in dict_edges:
+        source = _quote(edge["source"])
+        for path_name, target in edge["paths"].items():
+            lines.append(
+                f"\t{source} -> {_quote(target)}"
+                f" [label={_quote(path_name)} style=dashed]"
+            )
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+@cli.command()
+def graph(
+    script_path: str = typer.Argument(..., help="Path to the Python script"),
+    output_file: str = typer.Option(
+        "workflow_graph.svg", "--output", "-o", help="Output file for the graph"
+    ),
+    output_format: Optional[str] = typer.Option(
+        None,
+        "--format",
+        "-f",
+        help="Output format (svg, png, pdf, ...); defaults to the output suffix",
+    ),
+):
+    script_file = Path(script_path)
+    if not script_file.exists():
+        _console().print(f"[red]Error: Script '{script_path}' not found.[/red]")
+        raise typer.Exit(1)
+    try:
+        workflow = _load_workflow(script_file)
+        if not workflow:
+            _console().print(
+                f"[red]Error: No Workflow instance found in '{script_path}'.[/red]"
+            )
+            raise typer.Exit(1)
+        _console().print(
+            f"[blue]Generating graph for workflow '{workflow.name}'...[/blue]"
+        )
+        try:
+            import graphviz
+        except ImportError:
+            _console().print(
+                "[red]Error: graphviz package not installed. Install with: pip install graphviz[/red]"
+            )
+            raise typer.Exit(1)
+        output_path = Path(output_file)
+        fmt = output_format or output_path.suffix.lstrip(".") or "svg"
+        graphviz.Source(_dot_source(workflow)).render(
+            output_path.with_suffix(""), format=fmt, cleanup=True
+        )
+        _console().print(
+            f"[green]✅ Graph saved to: {output_path.with_suffix(f'.{fmt}')}[/green]"
+        )
+    except Exception as e:
+        _console().print(f"[red]Graph generation failed: {e}[/red]")
+        raise typer.Exit(1)
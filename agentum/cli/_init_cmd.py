@@ -0,0 +1,31 @@
+import functools
+from importlib import resources
+from pathlib import Path
+
+import typer
+
+from ._common import _console
+
+cli = typer.Typer(add_completion=False)
+
+
+@functools.cache
+def _template() -> str:
+    return (
+        resources.files("agentum.cli")
+        .joinpath("templates/workflow.py.tmpl")
+        .read_text(encoding="utf-8")
+    )
+
+
+@cli.command()
+def init(
+    name: str = typer.Argument(..., help="Name of the workflow"),
+    output_dir: str = typer.Option(".", "--output", "-o", help="Output directory"),
+):
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    script_path = output_path / f"{name}.py"
+    script_path.write_text(_template().format_map({"name": name}), encoding="utf-8")
+    _console().print(f"[green]Created workflow template: {script_path}[/green]")
+    _console().print(f"[blue]Run it with: agentum run {script_path}[/blue]")
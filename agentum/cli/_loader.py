@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Optional
+
+from ._common import _console
+
+if TYPE_CHECKING:
+    from ..workflow.workflow import Workflow
+
+
+_SCRIPT_CACHE: dict[str, tuple[int, ModuleType]] = {}
+
+
+def _load_workflow_module(script_file: Path) -> ModuleType:
+    cache_key = str(script_file.resolve())
+    mtime = script_file.stat().st_mtime_ns
+    cached = _SCRIPT_CACHE.get(cache_key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    module_name = f"agentum_script_{hashlib.sha1(cache_key.encode()).hexdigest()[:16]}"
+    spec = importlib.util.spec_from_file_location(module_name, cache_key)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(module_name, None)
+        raise
+    _SCRIPT_CACHE[cache_key] = (mtime, module)
+    return module
+
+
+def _find_workflow(module: ModuleType) -> Optional[Workflow]:
+    from ..workflow.workflow import Workflow
+
+    workflow = getattr(module, "workflow", None)
+    if isinstance(workflow, Workflow):
+        return workflow
+    found = [(k, v) for k, v in vars(module).items() if isinstance(v, Workflow)]
+    if not found:
+        return None
+    if len(found) > 1:
+        names = ", ".join(name for name, _ in found)
+        _console().print(
+            f"[yellow]Warning: Multiple workflows found ({names}); "
+            f"using '{found[0][0]}'.[/yellow]"
+        )
+    return found[0][1]
+
+
+def _load_workflow(script_file: Path) -> Optional[Workflow]:
+    return _find_workflow(_load_workflow_module(script_file))
@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Optional
+
+import typer
+
+from ._common import _console
+from ._loader import _load_workflow
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    from rich.text import Text
+
+    from ..workflow.workflow import Workflow
+
+cli = typer.Typer(add_completion=False)
+
+_LOG_PANEL_TITLE = "[bold]Workflow Log[/bold]"
+_LOG_BORDER_STYLE = "white"
+_TASK_COLOR = "bold cyan"
+_LOG_HISTORY = 500
+_FINAL_STATE_DISPLAY_LIMIT = 10_000
+
+
+class _LogView:
+
+    def __init__(self, maxlen: int = _LOG_HISTORY):
+        self.lines: deque[str] = deque(maxlen=maxlen)
+        self._text: Optional[Text] = None
+
+    def append(self, message: str, style: str):
+        self.lines.append(f"[{style}]{message}[/]")
+        self._text = None
+
+    def __rich__(self) -> Text:
+        if self._text is None:
+            from rich.text import Text
+
+            self._text = Text.from_markup("\n".join(self.lines), style="dim")
+        return self._text
+
+
+def _parse_initial_state(raw: Optional[str]) -> dict:
+    if not raw:
+        return {}
+    state = json.loads(raw)
+    if not isinstance(state, dict):
+        raise json.JSONDecodeError("Expected a JSON object", raw, 0)
+    return state
+
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    if orjson is not None
+    else 0
+)
+
+
+def _json_default(value):
+    model_dump = getattr(value, "model_dump", None)
+    if model_dump is not None:
+        return model_dump()
+    return str(value)
+
+
+def _dumps_state(value: dict) -> str:
+    if orjson is None:
+        return json.dumps(value, indent=2, default=_json_default)
+    return orjson.dumps(
+        value, option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2, default=_json_default
+    ).decode()
+
+
+def _dumps_event(value: dict) -> bytes:
+    if orjson is None:
+        return json.dumps(value, default=_json_default).encode() + b"\n"
+    return orjson.dumps(
+        value,
+        option=_ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE,
+        default=_json_default,
+    )
+
+
+@functools.cache
+def _json_lexer_and_theme():
+    from pygments.lexers.data import JsonLexer
+    from rich.syntax import Syntax
+
+    return JsonLexer(), Syntax.get_theme("monokai")
+
+
+def _truncate_for_display(text: str, limit: int = _FINAL_STATE_DISPLAY_LIMIT) -> str:
+    if len(text) <= limit:
+        return text
+    return text[:limit] + "\n... (truncated; run without --stream for full output)"
+
+
+def _final_state_renderable(final_state: dict):
+    rendered = _dumps_state(final_state)
+    console = _console()
+    if (
+        len(rendered) > _FINAL_STATE_DISPLAY_LIMIT
+        or console.no_color
+        or not console.color_system
+    ):
+        from rich.text import Text
+
+        return Text(_truncate_for_display(rendered), no_wrap=True)
+    from rich.syntax import Syntax
+
+    lexer, theme = _json_lexer_and_theme()
+    return Syntax(
+        rendered,
+        lexer,
+        theme=theme,
+        line_numbers=True,
+        word_wrap=False,
+        background_color="default",
+    )
+
+
+def _default_executor_size() -> int:
+    from pydantic import ValidationError
+
+    from ..core.config import get_settings
+
+    try:
+        configured = get_settings().AGENTUM_THREAD_POOL_SIZE
+    except ValidationError:
+        # A bad setting should only fail workflows that build a tool pool.
+        configured = None
+    return configured or min(32, (os.cpu_count() or 1) * 2)
+
+
+def _run_async(coro):
+    loop_factory = None
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            loop_factory = uvloop.new_event_loop
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        loop = runner.get_loop()
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_task_factory is not None:
+            loop.set_task_factory(eager_task_factory)
+        loop.set_default_executor(
+            ThreadPoolExecutor(
+                max_workers=_default_executor_size(), thread_name_prefix="agentum"
+            )
+        )
+        return runner.run(coro)
+
+
+def make_layout():
+    from rich.layout import Layout
+    from rich.panel import Panel
+    from rich.text import Text
+
+    layout = Layout(name="root")
+    layout.split_column(
+        Layout(name="header", size=3),
+        Layout(name="log"),
+        Layout(name="final_state", size=10),
+    )
+    layout["header"].update(
+        Panel(
+            Text("🚀 Agentum Live Tracer", style="bold green", justify="center"),
+            title="[bold magenta]STATUS[/bold magenta]",
+            border_style="green",
+            height=3,
+        )
+    )
+    layout["final_state"].update(
+        Panel(
+            Text("Waiting for completion...", style="dim"),
+            title="[bold yellow]Final State[/bold yellow]",
+            border_style="yellow",
+        )
+    )
+    return layout
+
+
+@cli.command()
+def run(
+    script_path: str = typer.Argument(
+        ..., help="Path to the Python script containing the workflow"
+    ),
+    initial_state: Optional[str] = typer.Option(
+        None, "--state", "-s", help="Initial state as JSON string"
+    ),
+    thread_id: Optional[str] = typer.Option(
+        None, "--thread-id", "-t", help="Thread ID for state persistence"
+    ),
+    stream: bool = typer.Option(
+        False, "--stream", help="Stream workflow execution in real-time"
+    ),
+):
+    script_file = Path(script_path)
+    if not script_file.exists():
+        _console().print(f"[red]Error: Script '{script_path}' not found.[/red]")
+        raise typer.Exit(1)
+    if not script_file.suffix == ".py":
+        _console().print("[red]Error: Script must be a Python file (.py).[/red]")
+        raise typer.Exit(1)
+    plain = stream and not _console().is_terminal
+    ndjson = sys.stdout.buffer
+    # Piped --stream output stays pure NDJSON; engine and tool chatter goes to stderr.
+    with contextlib.redirect_stdout(sys.stderr) if plain else contextlib.nullcontext():
+        try:
+            workflow = _load_workflow(script_file)
+            if not workflow:
+                _console().print(
+                    f"[red]Error: No Workflow instance found in '{script_path}'.[/red]"
+                )
+                _console().print(
+                    "[yellow]Make sure your script defines a workflow variable.[/yellow]"
+                )
+                raise typer.Exit(1)
+            try:
+                state = _parse_initial_state(initial_state)
+            except json.JSONDecodeError as e:
+                _console().print(
+                    f"[red]Error: Invalid JSON in initial state: {e}[/red]"
+                )
+                raise typer.Exit(1)
+            try:
+                if plain:
+                    _run_async(_run_streaming_plain(workflow, state, thread_id, ndjson))
+                elif stream:
+                    _run_async(_run_streaming(workflow, state, thread_id))
+                else:
+                    _run_async(_run_workflow(workflow, state, thread_id))
+            finally:
+                workflow.close()
+        except Exception as e:
+            _console().print(f"[red]Error running workflow: {e}[/red]")
+            raise typer.Exit(1)
+
+
+async def _run_workflow(workflow: Workflow, state: dict, thread_id: Optional[str]):
+    _console().print(f"[green]Running workflow '{workflow.name}'...[/green]")
+    try:
+        result = await workflow.arun(state, thread_id=thread_id)
+        _console().print("\n[bold green]Workflow completed successfully![/bold green]")
+        _console().print("\n[bold]Final State:[/bold]")
+        _console().print(_dumps_state(result), markup=False)
+    except Exception as e:
+        _console().print(f"[red]Workflow failed: {e}[/red]")
+        raise
+
+
+async def _run_streaming_plain(
+    workflow: Workflow, state: dict, thread_id: Optional[str], out: BinaryIO
+):
+    async for event in workflow.astream(state, thread_id=thread_id):
+        if "__end__" in event:
+            break
+        out.write(_dumps_event(event))
+        out.flush()
+
+
+async def _run_streaming(workflow: Workflow, state: dict, thread_id: Optional[str]):
+    from rich.live import Live
+    from rich.markup import escape
+    from rich.panel import Panel
+
+    layout = make_layout()
+    log_view = _LogView()
+    layout["log"].update(
+        Panel(log_view, title=_LOG_PANEL_TITLE, border_style=_LOG_BORDER_STYLE)
+    )
+
+    def log(message: str, style: str = "white"):
+        log_view.append(message, style)
+
+    log(f"Starting workflow: {escape(workflow.name)}", "bold yellow")
+    log(f"Initial State: {escape(str(list(state.keys())))}", "dim")
+    final_state = dict(state)
+    try:
+        with Live(
+            layout, console=_console(), screen=False, refresh_per_second=4
+        ) as live:
+            async for event in workflow.astream(state, thread_id=thread_id):
+                if "__end__" in event:
+                    final_state = event["__end__"]
+                    break
+
+                for node_name, node_output in event.items():
+                    log(
+                        f"• [bold white]Task: {escape(node_name)}[/] finished.",
+                        _TASK_COLOR,
+                    )
+                    if node_output:
+                        final_state.update(node_output)
+                        log(
+                            f"  ↳ [dim]Updated State Keys:[/dim] {escape(', '.join(node_output))}",
+                            "dim",
+                        )
+
+            log("🏁 Workflow finished.", "bold green")
+            if final_state:
+                layout["final_state"].update(
+                    Panel(
+                        _final_state_renderable(final_state),
+                        title="[bold green]Final State[/bold green]",
+                        border_style="green",
+                    )
+                )
+            live.refresh()
+    except Exception as e:
+        log(f"❌ Workflow stream failed: {escape(str(e))}", "bold red")
+        _console().print(f"[red]Error: {e}[/red]")
+        raise
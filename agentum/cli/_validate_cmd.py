@@ -0,0 +1,69 @@
+from collections import defaultdict, deque
+from pathlib import Path
+
+import typer
+
+from ._common import _console
+from ._loader import _load_workflow
+
+cli = typer.Typer(add_completion=False)
+
+
+@cli.command()
+def validate(
+    script_path: str = typer.Argument(..., help="Path to the Python script to validate")
+):
+    script_file = Path(script_path)
+    if not script_file.exists():
+        _console().print(f"[red]Error: Script '{script_path}' not found.[/red]")
+        raise typer.Exit(1)
+    if not script_file.suffix == ".py":
+        _console().print("[red]Error: Script must be a Python file (.py).[/red]")
+        raise typer.Exit(1)
+    try:
+        workflow = _load_workflow(script_file)
+        if not workflow:
+            _console().print(
+                f"[red]Error: No Workflow instance found in '{script_path}'.[/red]"
+            )
+            _console().print(
+                "[yellow]Make sure your script defines a workflow variable.[/yellow]"
+            )
+            raise typer.Exit(1)
+        _console().print(f"[blue]Validating workflow '{workflow.name}'...[/blue]")
+        if not workflow.tasks:
+            _console().print("[red]❌ Error: Workflow has no tasks defined.[/red]")
+            raise typer.Exit(1)
+        if not workflow.entry_point:
+            _console().print("[red]❌ Error: No entry point set for workflow.[/red]")
+            raise typer.Exit(1)
+        if workflow.entry_point not in workflow.tasks:
+            _console().print(
+                f"[red]❌ Error: Entry point '{workflow.entry_point}' not found in tasks.[/red]"
+            )
+            raise typer.Exit(1)
+        successors: defaultdict[str, list[str]] = defaultdict(list)
+        for edge in workflow.edges:
+            if isinstance(edge, tuple):
+                successors[edge[0]].append(edge[1])
+            elif isinstance(edge, dict):
+                successors[edge["source"]].extend(edge["paths"].values())
+        reachable = {workflow.entry_point}
+        queue = deque([workflow.entry_point])
+        while queue:
+            for target in successors.get(queue.popleft(), ()):
+                if target not in reachable:
+                    reachable.add(target)
+                    queue.append(target)
+        disconnected = sorted(workflow.tasks.keys() - reachable)
+        if disconnected:
+            _console().print(
+                f"[yellow]⚠️  Warning: Disconnected tasks: {', '.join(disconnected)}[/yellow]"
+            )
+        _console().print("[green]✅ Workflow validation passed![/green]")
+        _console().print(f"[blue]Tasks: {len(workflow.tasks)}[/blue]")
+        _console().print(f"[blue]Edges: {len(workflow.edges)}[/blue]")
+        _console().print(f"[blue]Entry point: {workflow.entry_point}[/blue]")
+    except Exception as e:
+        _console().print(f"[red]Validation failed: {e}[/red]")
+        raise typer.Exit(1)
@@ -0,0 +1,12 @@
+import typer
+
+from ._common import _console
+
+cli = typer.Typer(add_completion=False)
+
+
+@cli.command()
+def version():
+    from .._version import __version__
+
+    _console().print(f"Agentum version: [bold green]{__version__}[/bold green]")
@@ -1,35 +1,37 @@
-from .config import Settings
-from .events import WorkflowEvents
-from .exceptions import (
-    AgentumError,
-    CompilationError,
-    ExecutionError,
-    MemoryError,
-    RAGError,
-    StateValidationError,
-    TaskConfigurationError,
-    ToolError,
-    WorkflowDefinitionError,
-)
-from .messages import AIMessage, HumanMessage, ToolMessage
+import importlib
 
-__all__ = [
+_LAZY = {
     # Config
-    "Settings",
+    "Settings": "agentum.core.config",
     # Events
-    "WorkflowEvents",
+    "WorkflowEvents": "agentum.core.events",
     # Exceptions
-    "AgentumError",
-    "CompilationError",
-    "ExecutionError",
-    "MemoryError",
-    "RAGError",
-    "StateValidationError",
-    "TaskConfigurationError",
-    "ToolError",
-    "WorkflowDefinitionError",
+    "AgentumError": "agentum.core.exceptions",
+    "CompilationError": "agentum.core.exceptions",
+    "ExecutionError": "agentum.core.exceptions",
+    "MemoryError": "agentum.core.exceptions",
+    "RAGError": "agentum.core.exceptions",
+    "StateValidationError": "agentum.core.exceptions",
+    "TaskConfigurationError": "agentum.core.exceptions",
+    "ToolError": "agentum.core.exceptions",
+    "WorkflowDefinitionError": "agentum.core.exceptions",
     # Messages
-    "AIMessage",
-    "HumanMessage",
-    "ToolMessage",
-]
+    "AIMessage": "agentum.core.messages",
+    "HumanMessage": "agentum.core.messages",
+    "ToolMessage": "agentum.core.messages",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(list(globals()) + __all__))
@@ -1,3 +1,6 @@
+import functools
+
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -11,6 +14,15 @@ class Settings(BaseSettings):
     COHERE_API_KEY: str | None = None
     TAVILY_API_KEY: str | None = None
     GOOGLE_CLOUD_PROJECT_ID: str | None = None
+    AGENTUM_THREAD_POOL_SIZE: int | None = Field(default=None, ge=1)
+
+
+@functools.cache
+def get_settings() -> Settings:
+    return Settings()
 
 
-settings = Settings()
+def __getattr__(name):
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,14 +1,26 @@
 from enum import Enum
+from typing import Final
+
+WORKFLOW_START: Final[str] = "workflow_start"
+WORKFLOW_FINISH: Final[str] = "workflow_finish"
+TASK_START: Final[str] = "task_start"
+TASK_FINISH: Final[str] = "task_finish"
+AGENT_START: Final[str] = "agent_start"
+AGENT_LLM_START: Final[str] = "agent_llm_start"
+AGENT_LLM_END: Final[str] = "agent_llm_end"
+AGENT_TOOL_CALL: Final[str] = "agent_tool_call"
+AGENT_TOOL_RESULT: Final[str] = "agent_tool_result"
+AGENT_END: Final[str] = "agent_end"
 
 
 class WorkflowEvents(str, Enum):
-    WORKFLOW_START = "workflow_start"
-    WORKFLOW_FINISH = "workflow_finish"
-    TASK_START = "task_start"
-    TASK_FINISH = "task_finish"
-    AGENT_START = "agent_start"
-    AGENT_LLM_START = "agent_llm_start"
-    AGENT_LLM_END = "agent_llm_end"
-    AGENT_TOOL_CALL = "agent_tool_call"
-    AGENT_TOOL_RESULT = "agent_tool_result"
-    AGENT_END = "agent_end"
+    WORKFLOW_START = WORKFLOW_START
+    WORKFLOW_FINISH = WORKFLOW_FINISH
+    TASK_START = TASK_START
+    TASK_FINISH = TASK_FINISH
+    AGENT_START = AGENT_START
+    AGENT_LLM_START = AGENT_LLM_START
+    AGENT_LLM_END = AGENT_LLM_END
+    AGENT_TOOL_CALL = AGENT_TOOL_CALL
+    AGENT_TOOL_RESULT = AGENT_TOOL_RESULT
+    AGENT_END = AGENT_END
@@ -0,0 +1,97 @@
+import asyncio
+import json
+import weakref
+from typing import Any, List, Tuple
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+_BATCH_HEADER = (
+    "You will receive {count} independent inputs, numbered INPUT 1 to INPUT {count}. "
+    "Handle each one separately, following the instructions it contains. "
+    "Reply with only a JSON array of {count} strings, where element i is your "
+    "complete answer to INPUT i+1."
+)
+
+
+def _batch_prompt(prompts: List[str]) -> str:
+    parts = [_BATCH_HEADER.format(count=len(prompts))]
+    for index, prompt in enumerate(prompts, 1):
+        parts.append(f"INPUT {index}:\n{prompt}")
+    return "\n\n".join(parts)
+
+
+def _split_batch_response(content: Any, count: int) -> List[str]:
+    text = content.strip() if isinstance(content, str) else ""
+    if text.startswith("```"):
+        text = text.strip("`").removeprefix("json").strip()
+    try:
+        answers = json.loads(text)
+    except ValueError:
+        return []
+    if not isinstance(answers, list) or len(answers) != count:
+        return []
+    return [a if isinstance(a, str) else json.dumps(a) for a in answers]
+
+
+class AgentBatcher:
+    """Coalesces concurrent prompts for one agent into a single LLM call."""
+
+    def __init__(
+        self, agent: Any, llm: Any, system_message: SystemMessage, batch_size: int
+    ):
+        self.agent = agent
+        self.llm = llm
+        self.system_message = system_message
+        self.batch_size = batch_size
+        self._pending = weakref.WeakKeyDictionary()
+
+    async def submit(self, prompt: str) -> Any:
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(loop)
+        if pending is None:
+            pending = self._pending[loop] = []
+            loop.call_soon(self._flush, loop)
+        future = loop.create_future()
+        pending.append((prompt, future))
+        if len(pending) >= self.batch_size:
+            del self._pending[loop]
+            loop.create_task(self._dispatch(pending))
+        return await future
+
+    def _flush(self, loop: asyncio.AbstractEventLoop):
+        pending = self._pending.pop(loop, None)
+        if pending:
+            loop.create_task(self._dispatch(pending))
+
+    async def _invoke_one(self, prompt: str) -> Any:
+        return await self.agent.invoke(
+            [self.system_message, HumanMessage(content=prompt)], llm=self.llm
+        )
+
+    async def _dispatch(self, batch: List[Tuple[str, asyncio.Future]]):
+        prompts = [prompt for prompt, _ in batch]
+        try:
+            if len(batch) == 1:
+                responses = [await self._invoke_one(prompts[0])]
+            else:
+                combined = await self.agent.invoke(
+                    [self.system_message, HumanMessage(content=_batch_prompt(prompts))],
+                    llm=self.llm,
+                )
+                answers = _split_batch_response(combined.content, len(batch))
+                if answers:
+                    responses = [AIMessage(content=answer) for answer in answers]
+                else:
+                    responses = await asyncio.gather(
+                        *(self._invoke_one(prompt) for prompt in prompts),
+                        return_exceptions=True,
+                    )
+        except Exception as e:
+            responses = [e] * len(batch)
+        for (_, future), response in zip(batch, responses):
+            if future.done():
+                continue
+            if isinstance(response, BaseException):
+                future.set_exception(response)
+            else:
+                future.set_result(response)
@@ -1,9 +1,33 @@
+import asyncio
+import functools
+import weakref
+from typing import Callable
+
 from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
 
 from ..core.exceptions import WorkflowDefinitionError
 from ..workflow.workflow import Workflow
-from .nodes import create_agent_node, create_tool_node
+from .batching import AgentBatcher
+from .nodes import _system_message, create_agent_node, create_tool_node
+
+
+def _concurrency_limiter(max_parallel: int) -> Callable[[Callable], Callable]:
+    semaphores = weakref.WeakKeyDictionary()
+
+    def limit(node_func: Callable) -> Callable:
+        @functools.wraps(node_func)
+        async def limited_node(state):
+            loop = asyncio.get_running_loop()
+            semaphore = semaphores.get(loop)
+            if semaphore is None:
+                semaphore = semaphores[loop] = asyncio.Semaphore(max_parallel)
+            async with semaphore:
+                return await node_func(state)
+
+        return limited_node
+
+    return limit
 
 
 class GraphCompiler:
@@ -13,13 +37,32 @@ class GraphCompiler:
 
     def compile(self) -> CompiledStateGraph:
         workflow_graph = StateGraph(self.workflow.state_model)
+        limit = None
+        if self.workflow.max_parallel:
+            limit = _concurrency_limiter(self.workflow.max_parallel)
+        batchers = {}
         for task_name, task_details in self.workflow.tasks.items():
             if task_details["agent"]:
-                node_func = create_agent_node(task_name, task_details, self.workflow)
+                batcher = None
+                if task_details.get("batchable"):
+                    agent = task_details["agent"]
+                    batcher = batchers.get(id(agent))
+                    if batcher is None:
+                        batcher = batchers[id(agent)] = AgentBatcher(
+                            agent,
+                            agent.llm,
+                            _system_message(agent.llm, agent.system_prompt),
+                            self.workflow.batch_size,
+                        )
+                node_func = create_agent_node(
+                    task_name, task_details, self.workflow, batcher=batcher
+                )
             elif task_details["tool"]:
                 node_func = create_tool_node(task_name, task_details, self.workflow)
             else:
                 continue
+            if limit is not None:
+                node_func = limit(node_func)
             workflow_graph.add_node(task_name, node_func)
         if not self.workflow.entry_point:
             raise WorkflowDefinitionError("Workflow entry point is not set.")
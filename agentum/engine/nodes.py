@@ -1,23 +1,130 @@
 import asyncio
 import base64
+import contextlib
+import contextvars
+import copy
+import functools
 import inspect
+import json
 import mimetypes
+import mmap
+import os
+import random
+import string
+import sys
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from langchain_core.messages import HumanMessage, ToolMessage
+from langchain_core.messages import HumanMessage, SystemMessage, ToolMessage
 from rich.console import Console
 from rich.panel import Panel
+from rich.text import Text
 
+from ..core import events
 from ..core.exceptions import ExecutionError, StateValidationError
 from ..providers.google import GoogleLLM
 from ..state.state import State
 from ..workflow.workflow import Workflow
+from .batching import AgentBatcher
 
 console = Console()
 
 SAFE_BASE_DIR = Path.cwd().resolve()
 
+_TOOL_NOT_FOUND = object()
+_IMAGE_FIELDS = frozenset({"image_path", "image_url"})
+_FORMATTER = string.Formatter()
+# Larger images are mapped instead of read, so b64encode works on the page cache.
+_IMAGE_MMAP_THRESHOLD = 1024 * 1024
+_VERBOSE = os.getenv("AGENTUM_VERBOSE") == "1"
+_MAX_CONCURRENT_RETRIES = 8
+_RETRY_SEMAPHORES = weakref.WeakKeyDictionary()
+_MAX_RETRY_DELAY = 30.0
+_RETRYABLE_STATUS = frozenset({408, 409, 429})
+# Provider SDK errors matched by name so no SDK has to be imported here.
+_RETRYABLE_ERROR_NAMES = frozenset(
+    {
+        "APIConnectionError",
+        "APITimeoutError",
+        "DeadlineExceeded",
+        "InternalServerError",
+        "RateLimitError",
+        "ResourceExhausted",
+        "ServiceUnavailable",
+    }
+)
+
+
+@functools.cache
+def _panel_executor() -> ThreadPoolExecutor:
+    # A single worker keeps panels in the order they were produced.
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="agentum-log")
+
+
+def _retry_semaphore(llm: Any) -> asyncio.Semaphore:
+    # Keyed per event loop, then per provider instance: semaphores are loop-bound.
+    per_loop = _RETRY_SEMAPHORES.setdefault(asyncio.get_running_loop(), {})
+    semaphore = per_loop.get(id(llm))
+    if semaphore is None:
+        limit = getattr(llm, "max_concurrent_retries", None) or _MAX_CONCURRENT_RETRIES
+        semaphore = per_loop[id(llm)] = asyncio.Semaphore(limit)
+    return semaphore
+
+
+async def _run_sync_tool(workflow: Workflow, tool_func, kwargs: Dict) -> Any:
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, tool_func, **kwargs)
+    return await loop.run_in_executor(workflow._get_tool_executor(), call)
+
+
+async def _call_tool(workflow: Workflow, tool_func, kwargs: Dict) -> Any:
+    pure = getattr(tool_func, "_is_pure", False)
+    if pure:
+        key = (tool_func, json.dumps(kwargs, sort_keys=True, default=str))
+        cached = workflow._pure_tool_results.get(key)
+        if cached is not None:
+            # Copied both ways so callers mutating a result cannot alter the cache.
+            return copy.deepcopy(cached)
+    if inspect.iscoroutinefunction(tool_func):
+        result = await tool_func(**kwargs)
+    else:
+        result = await _run_sync_tool(workflow, tool_func, kwargs)
+    if pure:
+        workflow._pure_tool_results.set(key, copy.deepcopy(result))
+    return result
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    httpx = sys.modules.get("httpx")
+    if httpx is not None and isinstance(exc, httpx.TransportError):
+        return True
+    status = getattr(exc, "status_code", None)
+    if isinstance(status, int):
+        return status in _RETRYABLE_STATUS or status >= 500
+    return type(exc).__name__ in _RETRYABLE_ERROR_NAMES
+
+
+def _retry_delay(exc: BaseException, attempt: int) -> float:
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if headers is not None:
+        try:
+            delay = float(headers.get("retry-after"))
+            return min(_MAX_RETRY_DELAY, max(0.0, delay))
+        except (TypeError, ValueError):
+            pass
+    return min(_MAX_RETRY_DELAY, (2**attempt) * (0.5 + random.random()))
+
+
+def _show_panel(body: str, title: str, border_style: str) -> None:
+    if not _VERBOSE:
+        return
+    panel = Panel(Text(body), title=title, border_style=border_style, padding=(1, 2))
+    _panel_executor().submit(console.print, panel)
+
 
 def _is_safe_path(path_str: str) -> bool:
     return (
@@ -28,59 +135,206 @@ def _is_safe_path(path_str: str) -> bool:
     )
 
 
+def _template_fields(template: str) -> List[str]:
+    fields = []
+    for _, field, format_spec, _ in _FORMATTER.parse(template):
+        if field:
+            fields.append(field)
+        if format_spec and "{" in format_spec:
+            # Nested fields such as "{value:>{width}}" are looked up too.
+            fields.extend(_template_fields(format_spec))
+    return fields
+
+
+@functools.lru_cache(maxsize=256)
+def _template_keys(template: str) -> Tuple[str, ...]:
+    keys = []
+    try:
+        fields = _template_fields(template)
+    except ValueError:
+        return ()
+    for field_name in fields:
+        root = field_name.split(".", 1)[0].split("[", 1)[0]
+        if root and root not in keys:
+            keys.append(root)
+    return tuple(keys)
+
+
+def _require_keys(keys: Tuple[str, ...], state_data: Dict) -> None:
+    missing = [key for key in keys if key not in state_data]
+    if missing:
+        raise StateValidationError(
+            f"Missing state key {', '.join(map(repr, missing))} required by template."
+        )
+
+
 def _safe_format(template: str, state_data: Dict) -> str:
     try:
         # Use Python's string formatting instead of Jinja2
         # Convert {variable} to {variable} for Python string formatting
-        return template.format(**state_data)
+        return template.format_map(state_data)
     except KeyError as e:
         raise StateValidationError(f"Missing state key {e} required by template.")
     except Exception as e:
         raise ExecutionError(f"Failed to render template: {e}")
 
 
-def create_agent_node(task_name: str, task_details: Dict, workflow: Workflow):
+def _system_message(llm: Any, system_prompt: str) -> SystemMessage:
+    # Anthropic only caches prefixes explicitly marked with cache_control; OpenAI
+    # and Gemini cache stable prefixes automatically.
+    anthropic = sys.modules.get("agentum.providers.anthropic")
+    if anthropic is not None and isinstance(llm, anthropic.AnthropicLLM):
+        return SystemMessage(
+            content=[
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+        )
+    return SystemMessage(content=system_prompt)
+
+
+def _template_formatter(template: str) -> Callable[[Dict], str]:
+    if "{" not in template and "}" not in template:
+        return lambda state_data: template
+    return functools.partial(_safe_format, template)
+
+
+@functools.lru_cache(maxsize=8)
+def _encode_small_image(path: str, mtime_ns: int, size: int) -> str:
+    with open(path, "rb") as image_file:
+        return base64.b64encode(image_file.read()).decode("ascii")
+
+
+def _encode_image_file(path: str, mtime_ns: int, size: int) -> str:
+    # Only small encodings are memoized so the cache stays a few MB at most.
+    if size < _IMAGE_MMAP_THRESHOLD:
+        return _encode_small_image(path, mtime_ns, size)
+    with open(path, "rb") as image_file:
+        with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return base64.b64encode(mapped).decode("ascii")
+
+
+def _safe_resolve(base_dir: Path, raw: str) -> Optional[Path]:
+    # Resolved on every call: a cached verdict would miss symlinks created later.
+    resolved = (base_dir / raw).resolve()
+    return resolved if resolved.is_relative_to(base_dir) else None
+
+
+@functools.lru_cache(maxsize=256)
+def _guess_mime_type(path: str) -> Optional[str]:
+    return mimetypes.guess_type(path)[0]
+
+
+def _image_meta(path: Path) -> Optional[Tuple[Optional[str], int, int]]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return _guess_mime_type(str(path)), stat.st_mtime_ns, stat.st_size
+
+
+def create_agent_node(
+    task_name: str,
+    task_details: Dict,
+    workflow: Workflow,
+    batcher: Optional[AgentBatcher] = None,
+):
     agent = task_details["agent"]
     instructions_template = task_details["instructions"]
-    output_mapping = task_details["output_mapping"]
-    if agent.tools:
+    instructions_keys = _template_keys(instructions_template)
+    instructions_fields = set(instructions_keys)
+    format_instructions = _template_formatter(instructions_template)
+    output_sources = tuple(
+        (state_key, source_key == "tool_result")
+        for state_key, source_key in (task_details["output_mapping"] or {}).items()
+    )
+    tool_by_name = {t.__name__: t for t in agent.tools or ()}
+    is_multimodal = isinstance(agent.llm, GoogleLLM)
+    state_fields = getattr(workflow.state_model, "model_fields", None)
+    accepts_images = state_fields is None or not _IMAGE_FIELDS.isdisjoint(state_fields)
+    system_message = _system_message(agent.llm, agent.system_prompt)
+    if _VERBOSE and agent.tools:
         console.print(
             f"    - Binding {len(agent.tools)} tools to LLM: {[t.__name__ for t in agent.tools]}"
         )
-        llm_with_tools = agent.llm.bind_tools(agent.tools)
-    else:
+    elif _VERBOSE:
         console.print("    - No tools available for this agent")
-        llm_with_tools = agent.llm
+    llm_with_tools = agent.bound_llm()
+
+    async def _run_tool_call(tool_call: Dict[str, Any]):
+        workflow._emit_nowait(
+            events.AGENT_TOOL_CALL,
+            tool_name=tool_call["name"],
+            tool_args=tool_call["args"],
+        )
+        tool_func = tool_by_name.get(tool_call["name"])
+        if not tool_func:
+            return (
+                ToolMessage(
+                    content=f"Error: Tool '{tool_call['name']}' not found.",
+                    tool_call_id=tool_call["id"],
+                ),
+                _TOOL_NOT_FOUND,
+            )
+        try:
+            result = await _call_tool(workflow, tool_func, tool_call["args"])
+            _show_panel(
+                str(result).strip(),
+                f"[bold green]Tool '{tool_call['name']}'[/bold green] Result",
+                "green",
+            )
+            workflow._emit_nowait(
+                events.AGENT_TOOL_RESULT,
+                tool_name=tool_call["name"],
+                result=result,
+            )
+            return (
+                ToolMessage(content=str(result), tool_call_id=tool_call["id"]),
+                result,
+            )
+        except Exception as e:
+            error_message = f"Error executing tool '{tool_call['name']}': {e}"
+            console.print(f"[bold red]    - {error_message}[/bold red]")
+            return (
+                ToolMessage(content=error_message, tool_call_id=tool_call["id"]),
+                None,
+            )
 
     async def agent_node(state: State) -> Dict[str, Any]:
-        await workflow._emit("task_start", task_name=task_name, state=state)
-        await workflow._emit("agent_start", agent_name=agent.name, state=state)
+        workflow._emit_nowait(events.TASK_START, task_name=task_name, state=state)
+        workflow._emit_nowait(events.AGENT_START, agent_name=agent.name, state=state)
         console.print(
             f"  Executing Agent Task: [bold magenta]{task_name}[/bold magenta]"
         )
         try:
-            formatted_instructions = _safe_format(
-                instructions_template, state.model_dump()
+            state_data = (
+                state.model_dump(include=instructions_fields)
+                if instructions_fields
+                else {}
             )
+            _require_keys(instructions_keys, state_data)
+            formatted_instructions = format_instructions(state_data)
         except Exception as e:
             raise StateValidationError(
                 f"Missing state key '{e}' required by task '{task_name}' instructions template."
             )
-        prompt_text = f"{agent.system_prompt}\n\n{formatted_instructions}"
-        message_content = [{"type": "text", "text": prompt_text}]
-        if isinstance(agent.llm, GoogleLLM):
+        message_content = [{"type": "text", "text": formatted_instructions}]
+        image_encoding = None
+        if accepts_images and is_multimodal:
             if hasattr(state, "image_path") and getattr(state, "image_path"):
                 image_path_str = getattr(state, "image_path")
 
                 try:
-                    user_path = SAFE_BASE_DIR / image_path_str
-                    resolved_path = user_path.resolve()
+                    resolved_path = _safe_resolve(SAFE_BASE_DIR, image_path_str)
 
-                    if not resolved_path.is_relative_to(SAFE_BASE_DIR):
+                    if resolved_path is None:
                         console.print(
                             f"[bold red]SECURITY ERROR: Path traversal detected in {image_path_str}. The path is outside the safe directory.[/bold red]"
                         )
-                    elif not resolved_path.exists():
+                    elif (image_meta := _image_meta(resolved_path)) is None:
                         console.print(
                             f"[yellow]Warning: Image file not found at {resolved_path}. Skipping image.[/yellow]"
                         )
@@ -88,19 +342,16 @@ def create_agent_node(task_name: str, task_details: Dict, workflow: Workflow):
                         console.print(
                             f"    - Attaching local image for analysis: {resolved_path}"
                         )
-                        mime_type, _ = mimetypes.guess_type(resolved_path)
+                        mime_type, mtime_ns, size = image_meta
                         if mime_type:
-                            with open(resolved_path, "rb") as image_file:
-                                base64_image = base64.b64encode(
-                                    image_file.read()
-                                ).decode("utf-8")
-                            message_content.append(
-                                {
-                                    "type": "image_url",
-                                    "image_url": {
-                                        "url": f"data:{mime_type};base64,{base64_image}"
-                                    },
-                                }
+                            # Encoded in the background while memory is loading.
+                            image_encoding = mime_type, asyncio.ensure_future(
+                                asyncio.to_thread(
+                                    _encode_image_file,
+                                    str(resolved_path),
+                                    mtime_ns,
+                                    size,
+                                )
                             )
                         else:
                             console.print(
@@ -116,120 +367,102 @@ def create_agent_node(task_name: str, task_details: Dict, workflow: Workflow):
                 message_content.append(
                     {"type": "image_url", "image_url": {"url": image_url}}
                 )
-        else:
+        elif accepts_images and (
+            getattr(state, "image_path", None) or getattr(state, "image_url", None)
+        ):
             console.print(
                 "[yellow]Warning: Agent LLM does not support multi-modal input. Image logic skipped.[/yellow]"
             )
+        memory = agent.memory
+        memory_load = None
+        if memory is not None:
+            memory_load = asyncio.ensure_future(
+                asyncio.to_thread(
+                    memory.load_messages, HumanMessage(content=list(message_content))
+                )
+            )
+        if image_encoding is not None:
+            mime_type, encoding = image_encoding
+            try:
+                base64_image = await encoding
+            except Exception as e:
+                console.print(
+                    f"[bold red]SECURITY ERROR: Could not process path {image_path_str}. Reason: {e}[/bold red]"
+                )
+            else:
+                message_content.append(
+                    {
+                        "type": "image_url",
+                        "image_url": {"url": f"data:{mime_type};base64,{base64_image}"},
+                    }
+                )
         human_message = HumanMessage(content=message_content)
-        messages = []
-        if agent.memory:
-            messages.extend(agent.memory.load_messages(human_message))
+        messages = [system_message]
+        if memory_load is not None:
+            messages.extend(await memory_load)
         messages.append(human_message)
         response = None
         last_tool_result = None
         for attempt in range(agent.max_retries):
+            retry_slot = (
+                _retry_semaphore(agent.llm) if attempt else contextlib.nullcontext()
+            )
             try:
-                while True:
-                    await workflow._emit("agent_llm_start", messages=messages)
-                    response = await llm_with_tools.ainvoke(messages)
-                    await workflow._emit("agent_llm_end", response=response)
-                    if not response.tool_calls:
-                        console.print(f"    - Agent '{agent.name}' responded directly.")
-                        agent_output = response.content.strip()
-                        console.print(
-                            Panel(
-                                agent_output,
-                                title=f"[bold blue]{agent.name}[/bold blue] Output",
-                                border_style="blue",
-                                padding=(1, 2),
-                            )
+                async with retry_slot:
+                    while True:
+                        workflow._emit_nowait(
+                            events.AGENT_LLM_START, messages=list(messages)
                         )
-                        break
-                    console.print(
-                        f"    - Agent '{agent.name}' wants to call tools: {[tc['name'] for tc in response.tool_calls]}"
-                    )
-                    messages.append(response)
-                    for tool_call in response.tool_calls:
-                        await workflow._emit(
-                            "agent_tool_call",
-                            tool_name=tool_call["name"],
-                            tool_args=tool_call["args"],
-                        )
-                        tool_func = next(
-                            (t for t in agent.tools if t.__name__ == tool_call["name"]),
-                            None,
-                        )
-                        if not tool_func:
-                            messages.append(
-                                ToolMessage(
-                                    content=f"Error: Tool '{tool_call['name']}' not found.",
-                                    tool_call_id=tool_call["id"],
-                                )
-                            )
-                            continue
-                        try:
-                            if inspect.iscoroutinefunction(tool_func):
-                                result = await tool_func(**tool_call["args"])
-                            else:
-                                result = await asyncio.to_thread(
-                                    tool_func, **tool_call["args"]
-                                )
-                            last_tool_result = result
-                            tool_output = str(result).strip()
+                        if batcher is not None and len(message_content) == 1:
+                            response = await batcher.submit(formatted_instructions)
+                        else:
+                            response = await agent.invoke(messages, llm=llm_with_tools)
+                        workflow._emit_nowait(events.AGENT_LLM_END, response=response)
+                        if not response.tool_calls:
                             console.print(
-                                Panel(
-                                    tool_output,
-                                    title=f"[bold green]Tool '{tool_call['name']}'[/bold green] Result",
-                                    border_style="green",
-                                    padding=(1, 2),
-                                )
-                            )
-                            await workflow._emit(
-                                "agent_tool_result",
-                                tool_name=tool_call["name"],
-                                result=result,
-                            )
-                            messages.append(
-                                ToolMessage(
-                                    content=str(result),
-                                    tool_call_id=tool_call["id"],
-                                )
+                                f"    - Agent '{agent.name}' responded directly."
                             )
-                        except Exception as e:
-                            last_tool_result = None
-                            error_message = (
-                                f"Error executing tool '{tool_call['name']}': {e}"
+                            _show_panel(
+                                response.content.strip(),
+                                f"[bold blue]{agent.name}[/bold blue] Output",
+                                "blue",
                             )
-                            console.print(f"[bold red]    - {error_message}[/bold red]")
-                            messages.append(
-                                ToolMessage(
-                                    content=error_message,
-                                    tool_call_id=tool_call["id"],
-                                )
-                            )
-                break
+                            break
+                        console.print(
+                            f"    - Agent '{agent.name}' wants to call tools: {[tc['name'] for tc in response.tool_calls]}"
+                        )
+                        messages.append(response)
+                        outcomes = await asyncio.gather(
+                            *(_run_tool_call(tc) for tc in response.tool_calls)
+                        )
+                        for tool_message, result in outcomes:
+                            messages.append(tool_message)
+                            if result is not _TOOL_NOT_FOUND:
+                                last_tool_result = result
+                    break
             except Exception as e:
+                if not _is_retryable(e):
+                    raise
                 console.print(
                     f"[bold yellow]  - Attempt {attempt + 1}/{agent.max_retries} failed: {e}[/bold yellow]"
                 )
                 if attempt + 1 == agent.max_retries:
-                    raise e
-                await asyncio.sleep(2**attempt)
+                    raise ExecutionError(
+                        f"Agent '{agent.name}' failed after {agent.max_retries} attempts: {e}"
+                    ) from e
+                await asyncio.sleep(_retry_delay(e, attempt))
         final_content = response.content
-        if agent.memory:
-            agent.memory.save_messages([human_message, response])
-        await workflow._emit(
-            "agent_end", agent_name=agent.name, final_response=final_content
+        if memory is not None:
+            await asyncio.to_thread(memory.save_messages, [human_message, response])
+        workflow._emit_nowait(
+            events.AGENT_END, agent_name=agent.name, final_response=final_content
         )
-        state_update = {}
-        if output_mapping:
-            for state_key, source_key in output_mapping.items():
-                if source_key == "tool_result":
-                    state_update[state_key] = last_tool_result
-                else:
-                    state_update[state_key] = final_content
+        state_update = {
+            state_key: last_tool_result if from_tool else final_content
+            for state_key, from_tool in output_sources
+        }
         await workflow._emit(
-            "task_finish", task_name=task_name, state_update=state_update
+            events.TASK_FINISH, task_name=task_name, state_update=state_update
         )
         return state_update
 
@@ -239,40 +472,38 @@ def create_agent_node(task_name: str, task_details: Dict, workflow: Workflow):
 def create_tool_node(task_name: str, task_details: Dict, workflow: Workflow):
     tool_func = task_details["tool"]
     input_mapping = task_details["inputs"] or {}
-    output_mapping = task_details["output_mapping"]
+    input_keys = tuple(
+        dict.fromkeys(k for t in input_mapping.values() for k in _template_keys(t))
+    )
+    input_fields = set(input_keys)
+    input_formatters = {
+        key: _template_formatter(template) for key, template in input_mapping.items()
+    }
+    output_keys = tuple(task_details["output_mapping"] or ())
 
     async def tool_node(state: State) -> Dict[str, Any]:
-        await workflow._emit("task_start", task_name=task_name, state=state)
+        workflow._emit_nowait(events.TASK_START, task_name=task_name, state=state)
         console.print(f"  Executing Tool Task: [bold cyan]{task_name}[/bold cyan]")
         try:
+            state_data = state.model_dump(include=input_fields) if input_fields else {}
+            _require_keys(input_keys, state_data)
             resolved_inputs = {
-                key: _safe_format(template, state.model_dump())
-                for key, template in input_mapping.items()
+                key: format_input(state_data)
+                for key, format_input in input_formatters.items()
             }
         except Exception as e:
             raise StateValidationError(
                 f"Error resolving inputs for tool '{task_name}': {e}"
             )
-        if inspect.iscoroutinefunction(tool_func):
-            result = await tool_func(**resolved_inputs)
-        else:
-            result = await asyncio.to_thread(tool_func, **resolved_inputs)
-        tool_output = str(result).strip()
-        console.print(
-            Panel(
-                tool_output,
-                title=f"[bold cyan]Tool '{task_name}'[/bold cyan] Result",
-                border_style="cyan",
-                padding=(1, 2),
-            )
+        result = await _call_tool(workflow, tool_func, resolved_inputs)
+        _show_panel(
+            str(result).strip(),
+            f"[bold cyan]Tool '{task_name}'[/bold cyan] Result",
+            "cyan",
         )
-        state_update = {}
-        if output_mapping:
-            state_update = {
-                state_key: result for state_key, response_key in output_mapping.items()
-            }
+        state_update = dict.fromkeys(output_keys, result)
         await workflow._emit(
-            "task_finish", task_name=task_name, state_update=state_update
+            events.TASK_FINISH, task_name=task_name, state_update=state_update
         )
         return state_update
 
@@ -1,4 +1,10 @@
-from .base import BaseMemory
+from .base import BaseMemory, MemoryProtocol
 from .implementations import ConversationMemory, SummaryMemory, VectorStoreMemory
 
-__all__ = ["BaseMemory", "ConversationMemory", "SummaryMemory", "VectorStoreMemory"]
+__all__ = [
+    "BaseMemory",
+    "MemoryProtocol",
+    "ConversationMemory",
+    "SummaryMemory",
+    "VectorStoreMemory",
+]
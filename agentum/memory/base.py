@@ -1,8 +1,15 @@
-from typing import List
+from typing import List, Protocol
 
 from langchain_core.messages import BaseMessage
 
 
+class MemoryProtocol(Protocol):
+
+    def load_messages(self, latest_input: BaseMessage) -> List[BaseMessage]: ...
+
+    def save_messages(self, messages: List[BaseMessage]): ...
+
+
 class BaseMemory:
 
     def load_messages(self, latest_input: BaseMessage) -> List[BaseMessage]:
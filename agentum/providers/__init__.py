@@ -1,5 +1,25 @@
-from .anthropic import AnthropicLLM
-from .google import GoogleLLM
-from .openai import OpenAILLM
+import importlib
 
-__all__ = ["GoogleLLM", "AnthropicLLM", "OpenAILLM"]
+from .base import BaseLLM
+
+_PROVIDERS = {
+    "AnthropicLLM": "anthropic",
+    "GoogleLLM": "google",
+    "OpenAILLM": "openai",
+}
+
+
+def __getattr__(name):
+    submodule = _PROVIDERS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(list(globals()) + list(_PROVIDERS)))
+
+
+__all__ = ["BaseLLM", "GoogleLLM", "AnthropicLLM", "OpenAILLM"]
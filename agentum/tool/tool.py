@@ -1,16 +1,25 @@
 import functools
-import inspect
 
-from pydantic import create_model
 
-
-def tool(func=None, *, name=None):
+def tool(func=None, *, name=None, pure=False):
 
     def decorator(f):
+        # Deferred so that binding agentum.tool at package import stays cheap.
+        import inspect
+
+        from pydantic import create_model
+
+        if inspect.iscoroutinefunction(f):
+
+            @functools.wraps(f)
+            async def wrapper(*args, **kwargs):
+                return await f(*args, **kwargs)
+
+        else:
 
-        @functools.wraps(f)
-        def wrapper(*args, **kwargs):
-            return f(*args, **kwargs)
+            @functools.wraps(f)
+            def wrapper(*args, **kwargs):
+                return f(*args, **kwargs)
 
         tool_name = name or f.__name__
         sig = inspect.signature(f)
@@ -19,6 +28,7 @@ def tool(func=None, *, name=None):
         }
         tool_schema = create_model(f"{tool_name}Schema", **fields)
         wrapper._is_agentum_tool = True
+        wrapper._is_pure = pure
         wrapper._tool_schema = tool_schema
         wrapper._tool_description = f.__doc__ or "No description provided."
         wrapper.__name__ = tool_name
@@ -2,13 +2,13 @@ from google.cloud import texttospeech
 from langchain_google_community import SpeechToTextLoader
 
 from agentum import tool
-from agentum.core.config import settings
+from agentum.core.config import get_settings
 
 
 @tool
 def transcribe_audio(audio_filepath: str, project_id: str | None = None) -> str:
     try:
-        proj_id = project_id or settings.GOOGLE_CLOUD_PROJECT_ID
+        proj_id = project_id or get_settings().GOOGLE_CLOUD_PROJECT_ID
         if not proj_id:
             return "Error: A Google Cloud Project ID was not provided and is not set in the environment (GOOGLE_CLOUD_PROJECT_ID)."
         loader = SpeechToTextLoader(project_id=proj_id, file_path=audio_filepath)
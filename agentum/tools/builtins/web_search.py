@@ -1,13 +1,13 @@
 from tavily import TavilyClient
 
 from agentum import tool
-from agentum.core.config import settings
+from agentum.core.config import get_settings
 
 
 @tool
 def search_web_tavily(query: str) -> str:
     try:
-        api_key = settings.TAVILY_API_KEY
+        api_key = get_settings().TAVILY_API_KEY
         if not api_key:
             return "Error: TAVILY_API_KEY environment variable is not set."
         client = TavilyClient(api_key=api_key)
@@ -1,28 +1,57 @@
 import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, AsyncGenerator, Callable, Dict, Optional, Type
 
 from rich.console import Console
 
+from ..cache.llm_cache import InMemoryBackend
+from ..core import events
+from ..core.config import get_settings
 from ..core.exceptions import TaskConfigurationError, WorkflowDefinitionError
 from ..state.state import State
 
 console = Console()
 
+_DEFAULT_TOOL_CONCURRENCY = 64
+_PURE_TOOL_CACHE_SIZE = 512
+
 
 class Workflow:
     END = "__end__"
 
     def __init__(
-        self, name: str, state: Type[State], persistence: Optional[str] = None
+        self,
+        name: str,
+        state: Type[State],
+        persistence: Optional[str] = None,
+        max_parallel: Optional[int] = None,
+        batch_size: int = 8,
+        tool_concurrency: Optional[int] = None,
     ):
+        if max_parallel is not None and max_parallel < 1:
+            raise WorkflowDefinitionError("max_parallel must be at least 1.")
+        if batch_size < 1:
+            raise WorkflowDefinitionError("batch_size must be at least 1.")
+        if tool_concurrency is not None and tool_concurrency < 1:
+            raise WorkflowDefinitionError("tool_concurrency must be at least 1.")
         self.name = name
         self.state_model = state
         self.persistence = persistence
+        self.max_parallel = max_parallel
+        self.batch_size = batch_size
+        self.tool_concurrency = tool_concurrency
+        self._tool_executor = None
+        self._tool_executor_lock = threading.Lock()
+        self._pure_tool_results = InMemoryBackend(maxsize=_PURE_TOOL_CACHE_SIZE)
         self.tasks = {}
         self.edges = []
         self.entry_point = None
         self._compiled_graph = None
+        self._compiled_revision = None
+        self._revision = 0
         self.event_listeners = {}
+        self._pending_events = set()
         console.print(f"✨ Workflow '{self.name}' initialized.", style="bold green")
 
     def on(self, event: str):
@@ -36,9 +65,30 @@ class Workflow:
         return decorator
 
     async def _emit(self, event: str, **kwargs):
-        if event in self.event_listeners:
-            for listener in self.event_listeners[event]:
-                await listener(**kwargs)
+        listeners = self.event_listeners.get(event)
+        if not listeners:
+            return
+        if len(listeners) == 1:
+            await listeners[0](**kwargs)
+        else:
+            await asyncio.gather(*(listener(**kwargs) for listener in listeners))
+
+    def _emit_nowait(self, event: str, **kwargs):
+        if event not in self.event_listeners:
+            return
+        task = asyncio.get_running_loop().create_task(self._emit(event, **kwargs))
+        self._pending_events.add(task)
+        task.add_done_callback(self._pending_events.discard)
+
+    async def _drain_events(self):
+        while self._pending_events:
+            pending = list(self._pending_events)
+            results = await asyncio.gather(*pending, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    console.print(
+                        f"[yellow]Warning: Event listener failed: {result}[/yellow]"
+                    )
 
     def add_task(
         self,
@@ -48,6 +98,7 @@ class Workflow:
         instructions: Optional[str] = None,
         inputs: Optional[Dict[str, Any]] = None,
         output_mapping: Optional[Dict[str, str]] = None,
+        batchable: bool = False,
     ):
         if name in self.tasks:
             raise TaskConfigurationError(f"Task '{name}' already exists.")
@@ -61,6 +112,10 @@ class Workflow:
             )
         if agent and (not instructions):
             raise TaskConfigurationError(f"Agent task '{name}' must have instructions.")
+        if batchable and (not agent or agent.tools or agent.memory is not None):
+            raise TaskConfigurationError(
+                f"Batchable task '{name}' must use an agent without tools or memory."
+            )
         if tool and (not inputs):
             console.print(
                 f"[yellow]Warning: Tool task '{name}' has no input mapping.[/yellow]"
@@ -71,7 +126,9 @@ class Workflow:
             "instructions": instructions,
             "inputs": inputs,
             "output_mapping": output_mapping,
+            "batchable": batchable,
         }
+        self._revision += 1
         console.print(f"  - Task added: [cyan]{name}[/cyan]")
 
     def add_edge(self, source: str, target: str):
@@ -80,6 +137,7 @@ class Workflow:
         if target not in self.tasks and target != self.END:
             raise WorkflowDefinitionError(f"Target task '{target}' does not exist.")
         self.edges.append((source, target))
+        self._revision += 1
         console.print(f"  - Edge added: [cyan]{source}[/cyan] -> [cyan]{target}[/cyan]")
 
     def add_conditional_edges(self, source: str, path: Callable, paths: Dict[str, str]):
@@ -90,6 +148,7 @@ class Workflow:
                 raise WorkflowDefinitionError(f"Path target '{target}' does not exist.")
         console.print(f"  - Conditional Edge added from [cyan]{source}[/cyan]")
         self.edges.append({"source": source, "path": path, "paths": paths})
+        self._revision += 1
 
     def set_entry_point(self, task_name: str):
         if task_name not in self.tasks:
@@ -97,26 +156,51 @@ class Workflow:
                 f"Entry point task '{task_name}' does not exist."
             )
         self.entry_point = task_name
+        self._revision += 1
         console.print(f"  - Entry point set to: [cyan]{task_name}[/cyan]")
 
     def _compile(self):
-        if not self._compiled_graph:
+        if self._compiled_graph is None or self._compiled_revision != self._revision:
             console.print(
                 "\n🔧 [bold]Compiling workflow into an executable graph...[/bold]",
                 style="blue",
             )
             from ..engine import GraphCompiler
 
-            compiler = GraphCompiler(self)
-            self._compiled_graph = compiler.compile()
+            self._compiled_graph = GraphCompiler(self).compile()
+            self._compiled_revision = self._revision
             console.print("✅ [bold]Compilation successful.[/bold]", style="green")
         return self._compiled_graph
 
+    def _get_tool_executor(self) -> ThreadPoolExecutor:
+        with self._tool_executor_lock:
+            if self._tool_executor is None:
+                workers = self.tool_concurrency
+                if workers is None:
+                    workers = (
+                        get_settings().AGENTUM_THREAD_POOL_SIZE
+                        or _DEFAULT_TOOL_CONCURRENCY
+                    )
+                self._tool_executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="agentum-tool"
+                )
+            return self._tool_executor
+
+    def close(self):
+        """Shuts down the tool thread pool and drops memoized pure-tool results."""
+        self._pure_tool_results = InMemoryBackend(maxsize=_PURE_TOOL_CACHE_SIZE)
+        with self._tool_executor_lock:
+            executor, self._tool_executor = self._tool_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
     def run(self, initial_state: Dict) -> Dict:
         return asyncio.run(self.arun(initial_state))
 
     async def arun(self, initial_state: Dict, thread_id: Optional[str] = None) -> Dict:
-        await self._emit("workflow_start", workflow_name=self.name, state=initial_state)
+        await self._emit(
+            events.WORKFLOW_START, workflow_name=self.name, state=initial_state
+        )
         console.print(
             f"\n🚀 [bold]Running workflow '{self.name}'...[/bold]", style="yellow"
         )
@@ -128,9 +212,14 @@ class Workflow:
             checkpointer = RedisSaver.from_url(self.persistence)
             config = {"configurable": {"thread_id": thread_id}}
             runnable_graph = runnable_graph.with_checkpoints(checkpointer)
-        final_state = await runnable_graph.ainvoke(initial_state, config=config)
+        try:
+            final_state = await runnable_graph.ainvoke(initial_state, config=config)
+        finally:
+            await self._drain_events()
         console.print("\n🏁 [bold]Workflow finished.[/bold]", style="yellow")
-        await self._emit("workflow_finish", workflow_name=self.name, state=final_state)
+        await self._emit(
+            events.WORKFLOW_FINISH, workflow_name=self.name, state=final_state
+        )
         return final_state
 
     async def astream(
@@ -147,6 +236,9 @@ class Workflow:
             checkpointer = RedisSaver.from_url(self.persistence)
             config = {"configurable": {"thread_id": thread_id}}
             runnable_graph = runnable_graph.with_checkpoints(checkpointer)
-        async for event in runnable_graph.astream(initial_state, config=config):
-            yield event
+        try:
+            async for event in runnable_graph.astream(initial_state, config=config):
+                yield event
+        finally:
+            await self._drain_events()
         console.print("\n🏁 [bold]Workflow stream finished.[/bold]", style="yellow")
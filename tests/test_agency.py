@@ -309,3 +309,66 @@ class TestAgency:
         compiler = GraphCompiler(workflow)
         compiled_graph = compiler.compile()
         assert compiled_graph is not None
+
+    def test_agent_binds_tools_once(self):
+        @tool
+        def lookup(query: str) -> str:
+            return query
+
+        llm = MockAsyncLLM()
+        llm.bind_tools_mock.side_effect = lambda tools: llm
+        agent = Agent(name="Binder", system_prompt="s", llm=llm, tools=[lookup])
+        assert agent.bound_llm() is agent.bound_llm()
+        assert llm.bind_tools_mock.call_count == 1
+        agent.tools = [lookup, lookup]
+        agent.bound_llm()
+        assert llm.bind_tools_mock.call_count == 2
+        agent.tools.append(lookup)
+        agent.bound_llm()
+        assert llm.bind_tools_mock.call_count == 3
+        agent.llm = other = MockAsyncLLM()
+        other.bind_tools_mock.side_effect = lambda tools: other
+        assert agent.bound_llm() is other
+        assert other.bind_tools_mock.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_pure_tools_are_memoized_and_async_tools_awaited(self):
+        from agentum.engine.nodes import _call_tool, create_tool_node
+
+        calls = []
+
+        @tool(pure=True)
+        def double(text: str) -> str:
+            calls.append(text)
+            return text * 2
+
+        @tool
+        async def shout(text: str) -> str:
+            return text.upper()
+
+        workflow = Workflow(name="PureTools", state=AgencyState)
+        details = {"inputs": {"text": "{request}"}, "output_mapping": {"response": "x"}}
+        double_node = create_tool_node("double", {"tool": double, **details}, workflow)
+        first = await double_node(AgencyState(request="ab"))
+        second = await double_node(AgencyState(request="ab"))
+        assert first == second == {"response": "abab"}
+        assert calls == ["ab"]
+        other = Workflow(name="OtherPureTools", state=AgencyState)
+        other_node = create_tool_node("double", {"tool": double, **details}, other)
+        await other_node(AgencyState(request="ab"))
+        assert calls == ["ab", "ab"]
+        other.close()
+        workflow.close()
+        await double_node(AgencyState(request="ab"))
+        assert calls == ["ab", "ab", "ab"]
+
+        @tool(pure=True)
+        def listing(text: str) -> list:
+            return [text]
+
+        result = await _call_tool(workflow, listing, {"text": "a"})
+        result.append("mutated")
+        assert await _call_tool(workflow, listing, {"text": "a"}) == ["a"]
+
+        shout_node = create_tool_node("shout", {"tool": shout, **details}, workflow)
+        assert await shout_node(AgencyState(request="hi")) == {"response": "HI"}
@@ -0,0 +1,115 @@
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from agentum import Agent, LLMCache
+from agentum.cache import DiskBackend, InMemoryBackend
+from tests.mock_llm import MockAsyncLLM
+
+
+def _make_agent(temperature, cache):
+    llm = MockAsyncLLM(side_effect=lambda messages: AIMessage(content="cached"))
+    llm.temperature = temperature
+    llm.model = "mock-model"
+    agent = Agent(
+        name="CacheAgent", system_prompt="You are cached.", llm=llm, cache=cache
+    )
+    return agent, llm
+
+
+class TestLLMCache:
+
+    @pytest.mark.asyncio
+    async def test_repeated_deterministic_prompt_hits_cache(self):
+        agent, llm = _make_agent(0, LLMCache())
+        messages = [HumanMessage(content="hello")]
+        first = await agent.invoke(messages)
+        second = await agent.invoke(messages)
+        assert first.content == second.content == "cached"
+        assert llm.ainvoke_mock.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_non_zero_temperature_bypasses_cache(self):
+        agent, llm = _make_agent(0.7, LLMCache())
+        messages = [HumanMessage(content="hello")]
+        await agent.invoke(messages)
+        await agent.invoke(messages)
+        assert llm.ainvoke_mock.await_count == 2
+
+    def test_key_depends_on_messages_and_tools(self):
+        agent, llm = _make_agent(0, None)
+
+        def lookup(query: str) -> str:
+            return query
+
+        base = LLMCache.make_key(llm, "sys", [HumanMessage(content="a")])
+        assert base == LLMCache.make_key(llm, "sys", [HumanMessage(content="a")])
+        assert base != LLMCache.make_key(llm, "sys", [HumanMessage(content="b")])
+        assert base != LLMCache.make_key(
+            llm, "sys", [HumanMessage(content="a")], [lookup]
+        )
+
+    def test_in_memory_backend_evicts_least_recently_used(self):
+        backend = InMemoryBackend(maxsize=2)
+        backend.set("a", 1)
+        backend.set("b", 2)
+        backend.get("a")
+        backend.set("c", 3)
+        assert backend.get("b") is None
+        assert backend.get("a") == 1
+        assert backend.get("c") == 3
+
+    def test_disk_backend_round_trip_and_expiry(self, tmp_path):
+        backend = DiskBackend(str(tmp_path / "cache" / "agent.sqlite"))
+        backend.set("key", AIMessage(content="persisted"))
+        assert backend.get("key").content == "persisted"
+        backend.set("stale", "value", ttl=-1)
+        assert backend.get("stale") is None
+        reopened = DiskBackend(str(tmp_path / "cache" / "agent.sqlite"))
+        assert reopened.get("key").content == "persisted"
+        assert isinstance(reopened.get("key"), AIMessage)
+        reopened.set("plain", {"answer": 42})
+        assert reopened.get("plain") == {"answer": 42}
+
+    def test_disk_backend_ignores_non_json_rows(self, tmp_path):
+        import pickle
+
+        backend = DiskBackend(str(tmp_path / "agent.sqlite"))
+        backend._conn.execute(
+            "INSERT INTO llm_cache (key, value, expires_at) VALUES (?, ?, NULL)",
+            ("legacy", pickle.dumps(AIMessage(content="old"))),
+        )
+        assert backend.get("legacy") is None
+
+    @pytest.mark.asyncio
+    async def test_semantic_tier_serves_near_duplicate_prompts(self):
+        vectors = {"hello there": [1.0, 0.0], "hello there!": [0.99, 0.05]}
+
+        def embed(text):
+            return vectors.get(text, [0.0, 1.0])
+
+        agent, llm = _make_agent(0, LLMCache(embedder=embed))
+        await agent.invoke([HumanMessage(content="hello there")])
+        await agent.invoke([HumanMessage(content="hello there!")])
+        assert llm.ainvoke_mock.await_count == 1
+        await agent.invoke([HumanMessage(content="unrelated")])
+        assert llm.ainvoke_mock.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_semantic_tier_skips_messages_with_images(self):
+        agent, llm = _make_agent(0, LLMCache(embedder=lambda text: [1.0, 0.0]))
+        for url in ("data:image/png;base64,AAAA", "data:image/png;base64,BBBB"):
+            content = [
+                {"type": "text", "text": "Describe this image"},
+                {"type": "image_url", "image_url": {"url": url}},
+            ]
+            await agent.invoke([HumanMessage(content=content)])
+        assert llm.ainvoke_mock.await_count == 2
+
+    def test_semantic_tier_skips_tool_call_responses(self):
+        cache = LLMCache(embedder=lambda text: [1.0, 0.0])
+        vector = cache.embed([HumanMessage(content="x")])
+        tool_call = AIMessage(
+            content="", tool_calls=[{"name": "t", "args": {}, "id": "1"}]
+        )
+        cache.set_similar("scope", "key", vector, tool_call)
+        assert cache.get_similar("scope", vector) is None
@@ -0,0 +1,425 @@
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from agentum.cli.main import app
+
+runner = CliRunner()
+
+WORKFLOW_SCRIPT = """
+from agentum import State, Workflow
+
+
+class EchoState(State):
+    text: str
+    echoed: str = ""
+
+
+def echo(text: str) -> str:
+    return text.upper()
+
+
+workflow = Workflow(name="EchoWorkflow", state=EchoState)
+workflow.add_task(
+    name="echo", tool=echo, inputs={"text": "{text}"}, output_mapping={"echoed": "x"}
+)
+workflow.set_entry_point("echo")
+workflow.add_edge("echo", workflow.END)
+"""
+
+
+@pytest.fixture
+def workflow_script(tmp_path):
+    script = tmp_path / "echo_workflow.py"
+    script.write_text(WORKFLOW_SCRIPT)
+    return script
+
+
+class TestCli:
+
+    def test_validate_passes_for_connected_workflow(self, workflow_script):
+        result = runner.invoke(app, ["validate", str(workflow_script)])
+        assert result.exit_code == 0
+        assert "validation passed" in result.output
+
+    def test_validate_rejects_missing_script(self, tmp_path):
+        result = runner.invoke(app, ["validate", str(tmp_path / "missing.py")])
+        assert result.exit_code == 1
+        assert "Error: Script" in result.output
+
+    def test_run_prints_final_state(self, workflow_script):
+        result = runner.invoke(
+            app, ["run", str(workflow_script), "--state", '{"text": "hi"}']
+        )
+        assert result.exit_code == 0
+        assert '"echoed": "HI"' in result.output
+
+    @pytest.mark.parametrize("state", ["{bad", "[1]", "3"])
+    def test_run_rejects_invalid_state_json(self, workflow_script, state):
+        result = runner.invoke(app, ["run", str(workflow_script), "--state", state])
+        assert result.exit_code == 1
+        assert "Invalid JSON" in result.output
+
+    def test_parse_initial_state_returns_fresh_objects(self):
+        from agentum.cli._run_cmd import _parse_initial_state
+
+        first = _parse_initial_state('{"items": []}')
+        first["items"].append(1)
+        assert _parse_initial_state('{"items": []}') == {"items": []}
+
+    def test_run_reports_missing_workflow(self, tmp_path):
+        script = tmp_path / "empty.py"
+        script.write_text("x = 1\n")
+        result = runner.invoke(app, ["run", str(script)])
+        assert result.exit_code == 1
+        assert "No Workflow instance found" in result.output
+
+    def test_init_writes_template(self, tmp_path):
+        result = runner.invoke(app, ["init", "Demo", "--output", str(tmp_path)])
+        assert result.exit_code == 0
+        assert (
+            'Workflow(name="Demo", state=DemoState)'
+            in (tmp_path / "Demo.py").read_text()
+        )
+
+    def test_script_module_is_cached_until_modified(self, workflow_script):
+        import os
+
+        from agentum.cli._loader import _load_workflow_module
+
+        first = _load_workflow_module(workflow_script)
+        assert _load_workflow_module(workflow_script) is first
+        assert sys.modules[first.__name__] is first
+        stat = workflow_script.stat()
+        os.utime(workflow_script, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert _load_workflow_module(workflow_script) is not first
+
+    def test_run_streaming_logs_finished_tasks(self, workflow_script, monkeypatch):
+        from rich.console import Console
+        from rich.text import Text
+
+        from agentum.cli import _run_cmd
+
+        monkeypatch.setattr(
+            _run_cmd, "_console", lambda: Console(force_terminal=True, width=120)
+        )
+        result = runner.invoke(
+            app, ["run", str(workflow_script), "--stream", "--state", '{"text": "hi"}']
+        )
+        assert result.exit_code == 0
+        plain = Text.from_ansi(result.output).plain
+        assert "Task: echo" in plain
+        assert '"echoed": "HI"' in plain
+
+    def test_run_streaming_writes_json_lines_when_piped(self, workflow_script):
+        import json
+
+        result = runner.invoke(
+            app, ["run", str(workflow_script), "--stream", "--state", '{"text": "hi"}']
+        )
+        assert result.exit_code == 0
+        events = [json.loads(line) for line in result.stdout.splitlines()]
+        assert events == [{"echo": {"echoed": "HI"}}]
+        assert "Workflow" in result.stderr
+
+    def test_dumps_state_handles_non_json_values(self):
+        from datetime import date
+
+        from agentum.cli._run_cmd import _dumps_state
+
+        rendered = _dumps_state({"day": date(2024, 1, 2), 3: "three"})
+        assert '"day": "2024-01-02"' in rendered
+        assert '"3": "three"' in rendered
+
+    def test_validate_warns_about_disconnected_tasks(self, tmp_path):
+        script = tmp_path / "orphan_workflow.py"
+        script.write_text(
+            WORKFLOW_SCRIPT
+            + 'workflow.add_task(name="orphan", tool=echo, inputs={"text": "{text}"})\n'
+            + "workflow.add_conditional_edges(\n"
+            + '    "echo", lambda state: "done", {"done": workflow.END}\n'
+            + ")\n"
+        )
+        result = runner.invoke(app, ["validate", str(script)])
+        assert result.exit_code == 0
+        assert "Disconnected tasks: orphan" in result.output
+
+    def test_validate_flags_islands_unreachable_from_entry_point(self, tmp_path):
+        script = tmp_path / "island_workflow.py"
+        script.write_text(
+            WORKFLOW_SCRIPT
+            + 'workflow.add_task(name="left", tool=echo, inputs={"text": "{text}"})\n'
+            + 'workflow.add_task(name="right", tool=echo, inputs={"text": "{text}"})\n'
+            + 'workflow.add_edge("left", "right")\n'
+            + 'workflow.add_edge("right", "left")\n'
+        )
+        result = runner.invoke(app, ["validate", str(script)])
+        assert result.exit_code == 0
+        assert "Disconnected tasks: left, right" in result.output
+
+    def test_graph_adds_end_node_once(self, tmp_path, monkeypatch):
+        graphviz = pytest.importorskip("graphviz")
+        rendered = []
+        monkeypatch.setattr(
+            graphviz.Source,
+            "render",
+            lambda self, *args, **kwargs: rendered.append(self.source),
+        )
+        script = tmp_path / "branching_workflow.py"
+        script.write_text(
+            WORKFLOW_SCRIPT
+            + "workflow.add_conditional_edges(\n"
+            + '    "echo", lambda state: "done", {"done": workflow.END}\n'
+            + ")\n"
+        )
+        result = runner.invoke(
+            app, ["graph", str(script), "--output", str(tmp_path / "graph.png")]
+        )
+        assert result.exit_code == 0
+        assert rendered[0].count('\t"__end__" [label=') == 1
+        assert '"echo" -> "__end__" [label="done" style=dashed]' in rendered[0]
+
+    def test_graph_defaults_to_svg_and_honours_format(self, tmp_path, monkeypatch):
+        graphviz = pytest.importorskip("graphviz")
+        formats = []
+        monkeypatch.setattr(
+            graphviz.Source,
+            "render",
+            lambda self, *args, **kwargs: formats.append(kwargs["format"]),
+        )
+        script = tmp_path / "echo_workflow.py"
+        script.write_text(WORKFLOW_SCRIPT)
+        default = runner.invoke(
+            app, ["graph", str(script), "-o", str(tmp_path / "graph")]
+        )
+        explicit = runner.invoke(
+            app, ["graph", str(script), "-o", str(tmp_path / "g"), "--format", "png"]
+        )
+        assert default.exit_code == explicit.exit_code == 0
+        assert formats == ["svg", "png"]
+        assert "g.png" in explicit.output
+
+    def test_log_view_keeps_bounded_history(self):
+        from agentum.cli._run_cmd import _LogView
+
+        view = _LogView(maxlen=2)
+        for i in range(5):
+            view.append(f"event {i}", "dim")
+        assert view.__rich__().plain == "event 3\nevent 4"
+
+    def test_log_view_renders_markup(self):
+        from agentum.cli._run_cmd import _LogView
+
+        view = _LogView()
+        view.append("[bold]Task: echo[/] finished.", "cyan")
+        text = view.__rich__()
+        assert text.plain == "Task: echo finished."
+        assert {span.style for span in text.spans} >= {"cyan", "bold"}
+
+    def test_log_view_rebuilds_text_only_after_append(self):
+        from agentum.cli._run_cmd import _LogView
+
+        view = _LogView()
+        view.append("first", "dim")
+        rendered = view.__rich__()
+        assert view.__rich__() is rendered
+        view.append("second", "dim")
+        assert view.__rich__() is not rendered
+
+    def test_truncate_for_display_caps_large_payloads(self):
+        from agentum.cli._run_cmd import _truncate_for_display
+
+        assert _truncate_for_display("short", limit=10) == "short"
+        clipped = _truncate_for_display("x" * 20, limit=10)
+        assert clipped.startswith("x" * 10 + "\n... (truncated")
+
+    def test_final_state_skips_highlighting_for_large_payloads(self, monkeypatch):
+        from rich.console import Console
+        from rich.syntax import Syntax
+        from rich.text import Text
+
+        from agentum.cli import _run_cmd
+
+        monkeypatch.setattr(_run_cmd, "_console", lambda: Console(force_terminal=True))
+        assert isinstance(_run_cmd._final_state_renderable({"a": 1}), Syntax)
+        large = {"a": "x" * _run_cmd._FINAL_STATE_DISPLAY_LIMIT}
+        assert isinstance(_run_cmd._final_state_renderable(large), Text)
+
+    def test_final_state_is_plain_text_without_colors(self, monkeypatch):
+        from rich.console import Console
+        from rich.text import Text
+
+        from agentum.cli import _run_cmd
+
+        monkeypatch.setattr(
+            _run_cmd, "_console", lambda: Console(force_terminal=True, no_color=True)
+        )
+        assert isinstance(_run_cmd._final_state_renderable({"a": 1}), Text)
+
+    def test_run_prints_final_state_without_markup(self, capsys):
+        from agentum.cli._run_cmd import _run_async, _run_workflow
+
+        class StubWorkflow:
+            name = "stub"
+
+            async def arun(self, state, thread_id=None):
+                return {"note": "[/oops]"}
+
+        _run_async(_run_workflow(StubWorkflow(), {}, None))
+        assert '"note": "[/oops]"' in capsys.readouterr().out
+
+    def test_version_command_prints_version(self):
+        from agentum import __version__
+
+        result = runner.invoke(app, ["version"])
+        assert result.exit_code == 0
+        assert __version__ in result.output
+
+    def test_version_constant_matches_package_metadata(self):
+        from importlib.metadata import PackageNotFoundError, version
+
+        from agentum._version import __version__
+
+        try:
+            assert version("agentum") == __version__
+        except PackageNotFoundError:
+            pytest.skip("agentum is not installed")
+
+    def test_main_short_circuits_version_flag(self, monkeypatch, capsys):
+        from agentum.cli import main as cli_main
+
+        monkeypatch.setattr(sys, "argv", ["agentum", "--version"])
+        with pytest.raises(SystemExit) as exit_info:
+            cli_main.main()
+        assert exit_info.value.code == 0
+        assert "Agentum version:" in capsys.readouterr().out
+
+    def test_invoking_one_command_imports_only_its_module(self, tmp_path):
+        import subprocess
+
+        code = (
+            "import sys\n"
+            "from typer.testing import CliRunner\n"
+            "from agentum.cli.main import app\n"
+            "CliRunner().invoke(app, ['init', 'Demo', '--output', sys.argv[1]])\n"
+            "print(' '.join(m for m in sys.modules if m.startswith('agentum.cli.')))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code, str(tmp_path)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        loaded = set(result.stdout.split())
+        assert "agentum.cli._init_cmd" in loaded
+        assert "agentum.cli._run_cmd" not in loaded
+        assert "agentum.cli._graph_cmd" not in loaded
+
+    def test_dumps_state_serializes_pydantic_models_as_objects(self, monkeypatch):
+        from pydantic import BaseModel
+
+        from agentum.cli import _run_cmd
+
+        class Point(BaseModel):
+            x: int
+
+        assert '"p": {\n    "x": 1\n  }' in _run_cmd._dumps_state({"p": Point(x=1)})
+        monkeypatch.setattr(_run_cmd, "orjson", None)
+        assert '"p": {\n    "x": 1\n  }' in _run_cmd._dumps_state({"p": Point(x=1)})
+
+    def test_dumps_state_falls_back_to_stdlib_json(self, monkeypatch):
+        from agentum.cli import _run_cmd
+
+        monkeypatch.setattr(_run_cmd, "orjson", None)
+        assert _run_cmd._dumps_state({"a": 1}) == '{\n  "a": 1\n}'
+
+    def test_run_async_falls_back_to_default_loop(self, monkeypatch):
+        import asyncio
+
+        from agentum.cli._run_cmd import _run_async
+
+        monkeypatch.setitem(sys.modules, "uvloop", None)
+
+        async def loop_type():
+            return type(asyncio.get_running_loop()).__module__
+
+        assert _run_async(loop_type()).startswith("asyncio")
+
+    def test_script_bytecode_is_cached_next_to_source(self, workflow_script):
+        import importlib.util
+        from pathlib import Path
+
+        from agentum.cli._loader import _load_workflow_module
+
+        if sys.dont_write_bytecode:
+            pytest.skip("bytecode writing disabled")
+        _load_workflow_module(workflow_script)
+        cached = Path(importlib.util.cache_from_source(str(workflow_script.resolve())))
+        assert cached.exists()
+
+    def test_find_workflow_prefers_conventional_name(self):
+        from types import ModuleType
+
+        from agentum import State, Workflow
+        from agentum.cli._loader import _find_workflow
+
+        module = ModuleType("script")
+        module.other = Workflow(name="other", state=State)
+        module.workflow = Workflow(name="main", state=State)
+        assert _find_workflow(module) is module.workflow
+        del module.workflow
+        assert _find_workflow(module) is module.other
+
+    def test_find_workflow_warns_about_multiple_candidates(self, capsys):
+        from types import ModuleType
+
+        from agentum import State, Workflow
+        from agentum.cli._loader import _find_workflow
+
+        module = ModuleType("script")
+        module.first = Workflow(name="first", state=State)
+        module.second = Workflow(name="second", state=State)
+        capsys.readouterr()
+        assert _find_workflow(module) is module.first
+        assert "Multiple workflows found (first, second)" in capsys.readouterr().out
+
+    def test_json_lexer_and_theme_are_built_once(self):
+        from agentum.cli._run_cmd import _json_lexer_and_theme
+
+        assert _json_lexer_and_theme() is _json_lexer_and_theme()
+
+    def test_run_async_sizes_default_executor(self):
+        import asyncio
+        import threading
+
+        from agentum.cli._run_cmd import _run_async
+
+        async def worker_name():
+            return await asyncio.to_thread(lambda: threading.current_thread().name)
+
+        assert _run_async(worker_name()).startswith("agentum")
+
+    def test_invalid_thread_pool_setting_falls_back(self, monkeypatch):
+        import os
+
+        from agentum.cli._run_cmd import _default_executor_size
+        from agentum.core.config import get_settings
+
+        monkeypatch.setenv("AGENTUM_THREAD_POOL_SIZE", "not-a-number")
+        get_settings.cache_clear()
+        try:
+            assert _default_executor_size() == min(32, (os.cpu_count() or 1) * 2)
+        finally:
+            get_settings.cache_clear()
+
+    @pytest.mark.skipif(sys.version_info < (3, 12), reason="needs eager tasks")
+    def test_run_async_uses_eager_task_factory(self):
+        import asyncio
+
+        from agentum.cli._run_cmd import _run_async
+
+        async def factory():
+            return asyncio.get_running_loop().get_task_factory()
+
+        assert _run_async(factory()) is asyncio.eager_task_factory
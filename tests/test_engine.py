@@ -133,6 +133,47 @@ class TestEngine:
         assert result["output"] == "Final response"
         assert mock_llm.ainvoke_mock.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_agent_node_runs_tool_calls_concurrently(self):
+        import threading
+
+        workflow = Workflow(name="TestWorkflow", state=TestState)
+        # Both calls must be in flight at once for the barrier to release.
+        barrier = threading.Barrier(2, timeout=5)
+
+        @tool
+        def slow_tool(query: str) -> str:
+            barrier.wait()
+            return f"done {query}"
+
+        tool_call_response = MagicMock()
+        tool_call_response.content = ""
+        tool_call_response.tool_calls = [
+            {"name": "slow_tool", "args": {"query": "a"}, "id": "call_a"},
+            {"name": "slow_tool", "args": {"query": "b"}, "id": "call_b"},
+        ]
+        final_response = MagicMock(content="Final response", tool_calls=[])
+        mock_llm = MockAsyncLLM()
+        mock_llm.ainvoke_mock.side_effect = [tool_call_response, final_response]
+        mock_llm.bind_tools_mock.return_value = mock_llm
+        agent = Agent(
+            name="TestAgent",
+            system_prompt="You are a test agent.",
+            llm=mock_llm,
+            tools=[slow_tool],
+        )
+        task_details = {
+            "agent": agent,
+            "instructions": "Process: {input}",
+            "output_mapping": {"output": "tool_result"},
+        }
+        node_func = create_agent_node("test_task", task_details, workflow)
+        result = await node_func(TestState(input="test input"))
+        workflow.close()
+        assert result["output"] == "done b"
+        sent = mock_llm.ainvoke_mock.call_args_list[1].args[0]
+        assert [m.tool_call_id for m in sent[-2:]] == ["call_a", "call_b"]
+
     @pytest.mark.asyncio
     async def test_tool_node_execution(self):
         workflow = Workflow(name="TestWorkflow", state=TestState)
@@ -158,8 +199,8 @@ class TestEngine:
         compiler = GraphCompiler(workflow)
         mock_llm = MockAsyncLLM()
         mock_llm.ainvoke_mock.side_effect = [
-            Exception("Network error"),
-            Exception("Rate limit"),
+            ConnectionError("Network error"),
+            TimeoutError("Rate limit"),
             MagicMock(content="Success response", tool_calls=[]),
         ]
         agent = Agent(
@@ -185,7 +226,7 @@ class TestEngine:
         workflow = Workflow(name="TestWorkflow", state=TestState)
         compiler = GraphCompiler(workflow)
         mock_llm = MockAsyncLLM()
-        mock_llm.ainvoke_mock.side_effect = Exception("Persistent error")
+        mock_llm.ainvoke_mock.side_effect = ConnectionError("Persistent error")
         agent = Agent(
             name="TestAgent",
             system_prompt="You are a test agent.",
@@ -199,10 +240,25 @@ class TestEngine:
         }
         node_func = create_agent_node("test_task", task_details, workflow)
         state = TestState(input="test input")
-        with pytest.raises(Exception, match="Persistent error"):
+        from agentum.core.exceptions import ExecutionError
+
+        with pytest.raises(ExecutionError, match="Persistent error") as exc_info:
             await node_func(state)
+        assert str(exc_info.value.__cause__) == "Persistent error"
         assert mock_llm.ainvoke_mock.call_count == 2
 
+    async def test_retry_semaphore_is_shared_per_provider(self):
+        from agentum.engine import nodes
+
+        llm = MockAsyncLLM()
+        llm.max_concurrent_retries = 2
+        semaphore = nodes._retry_semaphore(llm)
+        assert semaphore is nodes._retry_semaphore(llm)
+        assert semaphore is not nodes._retry_semaphore(MockAsyncLLM())
+        await semaphore.acquire()
+        await semaphore.acquire()
+        assert semaphore.locked()
+
     def test_compile_workflow(self):
         workflow = Workflow(name="TestWorkflow", state=TestState)
         workflow.add_task(
@@ -244,3 +300,420 @@ class TestEngine:
         compiler = GraphCompiler(workflow)
         compiled_graph = compiler.compile()
         assert compiled_graph is not None
+
+    @pytest.mark.parametrize("max_parallel, expected_peak", [(None, 2), (1, 1)])
+    async def test_fan_out_branches_respect_max_parallel(
+        self, max_parallel, expected_peak
+    ):
+        import asyncio
+
+        class FanState(State):
+            left: str = ""
+            right: str = ""
+
+        running = 0
+        peak = 0
+
+        async def branch(label: str) -> str:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            return label
+
+        workflow = Workflow(name="Fan", state=FanState, max_parallel=max_parallel)
+        workflow.add_task(name="start", tool=lambda: "go", inputs={})
+        workflow.add_task(
+            name="left",
+            tool=branch,
+            inputs={"label": "L"},
+            output_mapping={"left": "x"},
+        )
+        workflow.add_task(
+            name="right",
+            tool=branch,
+            inputs={"label": "R"},
+            output_mapping={"right": "x"},
+        )
+        workflow.set_entry_point("start")
+        workflow.add_edge("start", "left")
+        workflow.add_edge("start", "right")
+        workflow.add_edge("left", workflow.END)
+        workflow.add_edge("right", workflow.END)
+        result = await workflow.arun({})
+        assert (result["left"], result["right"]) == ("L", "R")
+        assert peak == expected_peak
+
+    def test_max_parallel_must_be_positive(self):
+        from agentum.core.exceptions import WorkflowDefinitionError
+
+        with pytest.raises(WorkflowDefinitionError):
+            Workflow(name="Bad", state=TestState, max_parallel=0)
+
+    async def test_tool_node_dumps_state_once_and_reports_missing_keys(self):
+        from agentum.core.exceptions import StateValidationError
+
+        dumps = []
+
+        class CountingState(TestState):
+            def model_dump(self, **kwargs):
+                dumps.append(kwargs)
+                return super().model_dump(**kwargs)
+
+        workflow = Workflow(name="TestWorkflow", state=CountingState)
+        task_details = {
+            "tool": lambda a, b: a + b,
+            "inputs": {"a": "{input}", "b": "{output}-{input}"},
+            "output_mapping": {"output": "output"},
+        }
+        node_func = create_tool_node("concat", task_details, workflow)
+        result = await node_func(CountingState(input="x", output="y"))
+        assert result["output"] == "xy-x"
+        assert dumps == [{"include": {"input", "output"}}]
+
+        task_details["inputs"] = {"a": "{nope} {gone}", "b": "{input}"}
+        node_func = create_tool_node("concat", task_details, workflow)
+        with pytest.raises(StateValidationError, match="'nope', 'gone'"):
+            await node_func(CountingState(input="x"))
+
+    def test_encode_image_b64_matches_one_shot_encoding(self, tmp_path):
+        import base64
+
+        from agentum.engine import nodes
+
+        image = tmp_path / "image.png"
+        payload = bytes(range(256)) * 1000 + b"tail"
+        image.write_bytes(payload)
+        mime_type, mtime_ns, size = nodes._image_meta(image)
+        assert mime_type == "image/png"
+        encoded = nodes._encode_image_file(str(image), mtime_ns, size)
+        assert encoded == base64.b64encode(payload).decode()
+        assert nodes._encode_image_file(str(image), mtime_ns, size) is encoded
+        assert nodes._image_meta(tmp_path / "missing.png") is None
+
+    def test_result_panels_only_render_when_verbose(self, monkeypatch):
+        from agentum.engine import nodes
+
+        printed = []
+        monkeypatch.setattr(nodes.console, "print", printed.append)
+        monkeypatch.setattr(nodes, "_VERBOSE", False)
+        nodes._show_panel("quiet", "Title", "green")
+        nodes._panel_executor().submit(lambda: None).result()
+        assert printed == []
+
+        monkeypatch.setattr(nodes, "_VERBOSE", True)
+        nodes._show_panel("[/not markup]", "Title", "green")
+        nodes._panel_executor().submit(lambda: None).result()
+        assert len(printed) == 1
+        assert printed[0].renderable.plain == "[/not markup]"
+
+    def test_safe_format_looks_up_only_referenced_keys(self):
+        from agentum.engine.nodes import _safe_format
+
+        lookups = []
+
+        class TrackingDict(dict):
+            def __getitem__(self, key):
+                lookups.append(key)
+                return super().__getitem__(key)
+
+            def keys(self):
+                lookups.append("<keys>")
+                return super().keys()
+
+        data = TrackingDict(input="x", output="y", unused="z")
+        assert _safe_format("{input}-{input}", data) == "x-x"
+        assert lookups == ["input", "input"]
+
+    @pytest.mark.asyncio
+    async def test_nested_format_spec_fields_are_included(self):
+        from agentum.engine.nodes import _template_keys
+
+        class PaddedState(TestState):
+            width: int = 5
+
+        assert _template_keys("{input:>{width}}") == ("input", "width")
+        workflow = Workflow(name="Padded", state=PaddedState)
+        task_details = {
+            "tool": lambda text: text,
+            "inputs": {"text": "{input:>{width}}"},
+            "output_mapping": {"output": "output"},
+        }
+        node_func = create_tool_node("pad", task_details, workflow)
+        result = await node_func(PaddedState(input="x"))
+        workflow.close()
+        assert result["output"] == "    x"
+
+    @pytest.mark.parametrize(
+        "reply, expected_calls",
+        [('["A1", "B2", "C3"]', 1), ("not json", 4)],
+    )
+    async def test_batchable_sibling_tasks_share_one_llm_call(
+        self, reply, expected_calls
+    ):
+        from langchain_core.messages import AIMessage
+
+        class FanState(State):
+            a: str = ""
+            b: str = ""
+            c: str = ""
+
+        prompts = []
+        system_prompts = []
+
+        async def answer(messages):
+            text = messages[-1].content
+            prompts.append(text)
+            system_prompts.append(messages[0].content)
+            if "INPUT 1:" in text:
+                return AIMessage(content=reply)
+            return AIMessage(content=text.rsplit(" ", 1)[-1])
+
+        llm = MockAsyncLLM(side_effect=answer)
+        agent = Agent(name="Classifier", system_prompt="Classify.", llm=llm)
+        workflow = Workflow(name="Batch", state=FanState)
+        workflow.add_task(name="start", tool=lambda: "go", inputs={})
+        for key, suffix in (("a", "1"), ("b", "2"), ("c", "3")):
+            workflow.add_task(
+                name=key,
+                agent=agent,
+                instructions=f"Label {key.upper()}{suffix}",
+                output_mapping={key: "output"},
+                batchable=True,
+            )
+            workflow.add_edge("start", key)
+            workflow.add_edge(key, workflow.END)
+        workflow.set_entry_point("start")
+        result = await workflow.arun({})
+        assert (result["a"], result["b"], result["c"]) == ("A1", "B2", "C3")
+        assert len(prompts) == expected_calls
+        assert system_prompts[0] == "Classify."
+        assert "Classify." not in prompts[0]
+
+    def test_batchable_task_rejects_tool_agents(self):
+        from agentum.core.exceptions import TaskConfigurationError
+
+        @tool
+        def lookup(query: str) -> str:
+            return query
+
+        agent = Agent(name="Agent", system_prompt="s", llm=MockLLM(), tools=[lookup])
+        workflow = Workflow(name="Bad", state=TestState)
+        with pytest.raises(TaskConfigurationError):
+            workflow.add_task(name="t", agent=agent, instructions="do", batchable=True)
+
+    async def test_sync_tools_run_on_the_workflow_tool_executor(self):
+        import threading
+
+        from agentum.core.exceptions import WorkflowDefinitionError
+
+        workflow = Workflow(name="Tools", state=TestState, tool_concurrency=2)
+        assert workflow._tool_executor is None
+        task_details = {
+            "tool": lambda: threading.current_thread().name,
+            "inputs": {},
+            "output_mapping": {"output": "output"},
+        }
+        node_func = create_tool_node("thread", task_details, workflow)
+        result = await node_func(TestState(input="x"))
+        assert result["output"].startswith("agentum-tool")
+        assert workflow._tool_executor._max_workers == 2
+        workflow.close()
+        assert workflow._tool_executor is None
+        result = await node_func(TestState(input="x"))
+        assert result["output"].startswith("agentum-tool")
+        workflow.close()
+        with pytest.raises(WorkflowDefinitionError):
+            Workflow(name="Bad", state=TestState, tool_concurrency=0)
+
+    def test_compile_is_cached_until_the_workflow_changes(self):
+        workflow = Workflow(name="Cached", state=TestState)
+        workflow.add_task(name="first", tool=lambda: "x", inputs={})
+        workflow.set_entry_point("first")
+        graph = workflow._compile()
+        assert workflow._compile() is graph
+
+        workflow.add_task(name="second", tool=lambda: "y", inputs={})
+        workflow.add_edge("first", "second")
+        recompiled = workflow._compile()
+        assert recompiled is not graph
+        assert "second" in recompiled.nodes
+
+    def test_literal_templates_skip_formatting(self):
+        from agentum.engine.nodes import _template_formatter
+
+        literal = "Summarize the report."
+        assert _template_formatter(literal)({}) is literal
+        assert _template_formatter("{{raw}} {input}")({"input": "x"}) == "{raw} x"
+
+    async def test_agent_node_sends_system_prompt_as_stable_prefix(self, monkeypatch):
+        import sys
+        import types
+
+        from langchain_core.messages import SystemMessage
+
+        from agentum.engine.nodes import _system_message
+
+        workflow = Workflow(name="Prefix", state=TestState)
+        mock_llm = MockAsyncLLM()
+        mock_llm.ainvoke_mock.return_value = MagicMock(content="ok", tool_calls=[])
+        agent = Agent(name="A", system_prompt="Static rules.", llm=mock_llm)
+        task_details = {
+            "agent": agent,
+            "instructions": "Handle {input}",
+            "output_mapping": {"output": "output"},
+        }
+        node_func = create_agent_node("prefix", task_details, workflow)
+        await node_func(TestState(input="x"))
+        sent = mock_llm.ainvoke_mock.call_args.args[0]
+        assert isinstance(sent[0], SystemMessage)
+        assert sent[0].content == "Static rules."
+        assert sent[-1].content == [{"type": "text", "text": "Handle x"}]
+
+        class FakeAnthropicLLM:
+            pass
+
+        fake_module = types.SimpleNamespace(AnthropicLLM=FakeAnthropicLLM)
+        monkeypatch.setitem(sys.modules, "agentum.providers.anthropic", fake_module)
+        marked = _system_message(FakeAnthropicLLM(), "Static rules.")
+        assert marked.content[0]["cache_control"] == {"type": "ephemeral"}
+
+    def test_thread_pool_size_setting_sizes_tool_executor(self, monkeypatch):
+        from agentum.core.config import get_settings
+
+        monkeypatch.setenv("AGENTUM_THREAD_POOL_SIZE", "5")
+        get_settings.cache_clear()
+        try:
+            workflow = Workflow(name="Sized", state=TestState)
+            assert workflow._get_tool_executor()._max_workers == 5
+            monkeypatch.setenv("AGENTUM_THREAD_POOL_SIZE", "not-a-number")
+            get_settings.cache_clear()
+            lazy = Workflow(name="Lazy", state=TestState, tool_concurrency=2)
+            assert lazy._get_tool_executor()._max_workers == 2
+            lazy.close()
+            explicit = Workflow(name="Explicit", state=TestState, tool_concurrency=3)
+            assert explicit._get_tool_executor()._max_workers == 3
+            workflow.close()
+            explicit.close()
+        finally:
+            get_settings.cache_clear()
+
+    async def test_image_is_encoded_alongside_memory_load(self, monkeypatch, tmp_path):
+        import base64
+
+        from agentum.engine import nodes
+
+        class ImageState(State):
+            input: str = ""
+            image_path: str = ""
+            output: str = ""
+
+        class RecordingMemory:
+            def __init__(self):
+                self.loaded = []
+
+            def load_messages(self, latest_input):
+                self.loaded.append(latest_input)
+                return []
+
+            def save_messages(self, messages):
+                pass
+
+        (tmp_path / "photo.png").write_bytes(b"png-bytes")
+        monkeypatch.setattr(nodes, "SAFE_BASE_DIR", tmp_path)
+        monkeypatch.setattr(nodes, "GoogleLLM", MockAsyncLLM)
+        mock_llm = MockAsyncLLM()
+        mock_llm.ainvoke_mock.return_value = MagicMock(content="seen", tool_calls=[])
+        memory = RecordingMemory()
+        agent = Agent(name="Eyes", system_prompt="s", llm=mock_llm, memory=memory)
+        task_details = {
+            "agent": agent,
+            "instructions": "Describe {input}",
+            "output_mapping": {"output": "output"},
+        }
+        workflow = Workflow(name="Images", state=ImageState)
+        node_func = create_agent_node("look", task_details, workflow)
+        await node_func(ImageState(input="it", image_path="photo.png"))
+        sent = mock_llm.ainvoke_mock.call_args.args[0][-1].content
+        expected = base64.b64encode(b"png-bytes").decode()
+        assert sent[1]["image_url"]["url"] == f"data:image/png;base64,{expected}"
+        assert len(memory.loaded) == 1
+
+    async def test_agent_node_skips_image_handling_without_image_fields(self, capsys):
+        workflow = Workflow(name="Text", state=TestState)
+        mock_llm = MockAsyncLLM()
+        mock_llm.ainvoke_mock.return_value = MagicMock(content="ok", tool_calls=[])
+        agent = Agent(name="Text", system_prompt="s", llm=mock_llm)
+        task_details = {
+            "agent": agent,
+            "instructions": "Echo {input}",
+            "output_mapping": {"output": "output", "raw": "tool_result"},
+        }
+        node_func = create_agent_node("text", task_details, workflow)
+        capsys.readouterr()
+        result = await node_func(TestState(input="x"))
+        assert result == {"output": "ok", "raw": None}
+        assert "multi-modal" not in capsys.readouterr().out
+
+    async def test_non_retryable_errors_fail_fast(self):
+        workflow = Workflow(name="FailFast", state=TestState)
+        mock_llm = MockAsyncLLM()
+        mock_llm.ainvoke_mock.side_effect = ValueError("bad request shape")
+        agent = Agent(name="A", system_prompt="s", llm=mock_llm, max_retries=3)
+        task_details = {
+            "agent": agent,
+            "instructions": "Process: {input}",
+            "output_mapping": {"output": "output"},
+        }
+        node_func = create_agent_node("fail_fast", task_details, workflow)
+        with pytest.raises(ValueError, match="bad request shape"):
+            await node_func(TestState(input="x"))
+        assert mock_llm.ainvoke_mock.call_count == 1
+
+    def test_retry_classification_and_retry_after(self):
+        from agentum.engine.nodes import _is_retryable, _retry_delay
+
+        class RateLimitError(Exception):
+            pass
+
+        class StatusError(Exception):
+            def __init__(self, status_code, headers=None):
+                self.status_code = status_code
+                self.response = MagicMock(headers=headers or {})
+
+        assert _is_retryable(RateLimitError())
+        assert _is_retryable(StatusError(503))
+        assert _is_retryable(StatusError(429))
+        assert not _is_retryable(StatusError(400))
+        assert not _is_retryable(KeyError("x"))
+        assert _retry_delay(StatusError(429, {"retry-after": "7"}), 0) == 7.0
+        assert _retry_delay(StatusError(429, {"retry-after": "86400"}), 0) == 30.0
+        assert 0.5 <= _retry_delay(StatusError(503), 0) <= 1.5
+        assert _retry_delay(StatusError(503), 10) <= 30
+
+    def test_safe_resolve_rechecks_symlinks_created_later(self, tmp_path):
+        from agentum.engine.nodes import _safe_resolve
+
+        base = tmp_path / "base"
+        base.mkdir()
+        outside = tmp_path / "secret.png"
+        outside.write_bytes(b"secret")
+        assert _safe_resolve(base, "x.png") == base / "x.png"
+        (base / "x.png").symlink_to(outside)
+        assert _safe_resolve(base, "x.png") is None
+        assert _safe_resolve(base, "../secret.png") is None
+
+    def test_large_images_are_encoded_through_mmap(self, tmp_path):
+        import base64
+
+        from agentum.engine import nodes
+
+        image = tmp_path / "large.png"
+        payload = bytes(range(256)) * (nodes._IMAGE_MMAP_THRESHOLD // 256 + 3)
+        image.write_bytes(payload)
+        _, mtime_ns, size = nodes._image_meta(image)
+        assert size >= nodes._IMAGE_MMAP_THRESHOLD
+        encoded = nodes._encode_image_file(str(image), mtime_ns, size)
+        assert encoded == base64.b64encode(payload).decode()
+        assert nodes._encode_image_file(str(image), mtime_ns, size) is not encoded
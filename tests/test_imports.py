@@ -0,0 +1,107 @@
+import subprocess
+import sys
+
+import agentum
+
+
+def _loaded_after(statement: str) -> set:
+    code = f"import sys; {statement}; print(' '.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyImports:
+
+    def test_import_agentum_defers_heavy_modules(self):
+        loaded = _loaded_after("import agentum")
+        assert "agentum.workflow.workflow" not in loaded
+        assert "agentum.providers" not in loaded
+        assert "langchain_core" not in loaded
+
+    def test_lazy_export_resolves_and_caches(self):
+        workflow_cls = agentum.Workflow
+        from agentum.workflow.workflow import Workflow
+
+        assert workflow_cls is Workflow
+        assert vars(agentum)["Workflow"] is Workflow
+
+    def test_unknown_attribute_raises(self):
+        try:
+            agentum.DoesNotExist
+        except AttributeError:
+            pass
+        else:
+            assert False, "Should have raised AttributeError"
+
+    def test_dir_lists_lazy_exports(self):
+        assert set(agentum.__all__) <= set(dir(agentum))
+
+    def test_tool_export_survives_subpackage_import(self):
+        code = (
+            "import agentum.tool.tool; from agentum import tool; "
+            "print(callable(tool) and tool.__module__)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "agentum.tool.tool"
+
+    def test_provider_access_skips_other_vendor_sdks(self):
+        loaded = _loaded_after("from agentum.providers import GoogleLLM")
+        assert "agentum.providers.google" in loaded
+        assert "langchain_anthropic" not in loaded
+        assert "langchain_openai" not in loaded
+
+    def test_star_import_exports_public_names(self):
+        namespace = {}
+        exec("from agentum import *", namespace)
+        assert isinstance(agentum.__all__, tuple)
+        assert namespace["Workflow"] is agentum.Workflow
+
+    def test_cli_import_defers_workflow_and_rich(self):
+        loaded = _loaded_after("import agentum.cli.main")
+        assert "agentum.workflow.workflow" not in loaded
+        assert "rich.console" not in loaded
+
+    def test_cli_command_modules_do_not_load_pygments(self):
+        loaded = _loaded_after(
+            "import agentum.cli._init_cmd, agentum.cli._version_cmd, "
+            "agentum.cli._run_cmd"
+        )
+        assert "rich.syntax" not in loaded
+        assert "pygments" not in loaded
+
+    def test_cli_package_resolves_rich_renderables_lazily(self):
+        from rich.syntax import Syntax
+
+        import agentum.cli
+
+        assert agentum.cli.Syntax is Syntax
+
+    def test_core_exceptions_skip_settings_and_messages(self):
+        loaded = _loaded_after("from agentum.core import AgentumError")
+        assert "agentum.core.exceptions" in loaded
+        assert "pydantic_settings" not in loaded
+        assert "langchain_core" not in loaded
+
+    def test_settings_are_built_on_first_access(self):
+        loaded = _loaded_after(
+            "import agentum.core.config as c; "
+            "assert c.get_settings.cache_info().currsize == 0; "
+            "assert c.settings is c.get_settings()"
+        )
+        assert "agentum.core.config" in loaded
+
+    def test_graph_compiler_exports_single_class(self):
+        import agentum.engine
+        from agentum.engine import compiler
+
+        classes = [
+            c
+            for module in (agentum.engine, compiler)
+            for c in vars(module).values()
+            if isinstance(c, type) and c.__name__ == "GraphCompiler"
+        ]
+        assert len(set(classes)) == 1
@@ -10,3 +10,67 @@ def test_workflow_initialization():
     assert wf.name == "TestWorkflow"
     assert wf.state_model == SimpleState
     assert wf.tasks == {}
+
+
+async def test_enum_listeners_receive_string_events():
+    from agentum.core.events import WORKFLOW_START, WorkflowEvents
+
+    wf = Workflow(name="TestWorkflow", state=SimpleState)
+    received = []
+
+    @wf.on(WorkflowEvents.WORKFLOW_START)
+    async def listener(**kwargs):
+        received.append(kwargs["workflow_name"])
+
+    await wf._emit(WORKFLOW_START, workflow_name=wf.name)
+    assert received == ["TestWorkflow"]
+    assert WorkflowEvents.WORKFLOW_START == WORKFLOW_START
+
+
+async def test_node_events_do_not_block_and_are_drained():
+    import asyncio
+
+    from agentum.core import events
+
+    class TextState(State):
+        value: str = ""
+
+    wf = Workflow(name="Events", state=TextState)
+    seen = []
+    release = asyncio.Event()
+
+    @wf.on(events.TASK_START)
+    async def slow_listener(task_name, state):
+        await release.wait()
+        seen.append(task_name)
+
+    async def tool_func():
+        release.set()
+        return "done"
+
+    wf.add_task(name="only", tool=tool_func, inputs={}, output_mapping={"value": "x"})
+    wf.set_entry_point("only")
+    wf.add_edge("only", wf.END)
+    result = await asyncio.wait_for(wf.arun({}), timeout=5)
+    assert result["value"] == "done"
+    assert seen == ["only"]
+    assert not wf._pending_events
+
+
+async def test_listeners_for_one_event_run_concurrently():
+    import asyncio
+
+    wf = Workflow(name="Listeners", state=SimpleState)
+    both_started = asyncio.Event()
+    started = []
+
+    async def listener(name):
+        started.append(name)
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+
+    wf.on("custom")(lambda: listener("a"))
+    wf.on("custom")(lambda: listener("b"))
+    await wf._emit("custom")
+    assert started == ["a", "b"]